@@ -7,8 +7,12 @@ import click
 import sys
 import os
 from datetime import datetime
-import json
-from typing import List, Dict, Any
+import orjson
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import List, Dict, Any, Optional
+import pandas as pd
 
 # Add project root to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -17,7 +21,15 @@ from config import config
 from data_fetcher import TwitterFetcher, RedditFetcher
 from scorer.hype_scorer import HypeScorer
 from utils.logger import setup_logger
-from utils.file_utils import save_to_csv, append_to_history, create_sample_ticker_file
+from utils.file_utils import append_to_history, create_sample_ticker_file
+
+# Columns written by save_results_to_csv, in output order
+CSV_RESULT_COLUMNS = [
+    'rank', 'ticker', 'hype_score', 'volume_score', 'sentiment_score',
+    'sentiment_confidence', 'mention_count', 'platforms', 'platform_count',
+    'sentiment_trend', 'timestamp'
+]
+CSV_ROUNDED_COLUMNS = ['hype_score', 'volume_score', 'sentiment_score', 'sentiment_confidence']
 
 class HypeFinder:
     """Main HypeFinder application class"""
@@ -25,46 +37,69 @@ class HypeFinder:
     def __init__(self, config_dict: Dict[str, Any]):
         self.config = config_dict
         self.logger = setup_logger('HypeFinder', config.get('output.log_level', 'INFO'))
-        
-        # Initialize components
-        self.twitter_fetcher = None
-        self.reddit_fetcher = None
-        self.hype_scorer = None
-        
-        self._initialize_components()
     
-    def _initialize_components(self):
-        """Initialize data fetchers and scorer"""
+    # Components are built lazily on first access, so commands that only
+    # inspect configuration (e.g. status) never open API connections
+    
+    @cached_property
+    def twitter_fetcher(self) -> Optional[TwitterFetcher]:
+        """Twitter fetcher, or None when credentials are missing"""
+        if not self._has_twitter_credentials():
+            self.logger.warning("Twitter credentials not found - Twitter fetching disabled")
+            return None
+        
         try:
-            # Initialize Twitter fetcher
-            twitter_config = self.config.get('twitter', {})
-            twitter_config.update(self.config.get('scraping', {}))
+            # Layer the shared scraping settings under the Twitter section
+            # without copying or mutating either dict
+            twitter_config = ChainMap(self.config.get('twitter', {}), self.config.get('scraping', {}))
             
-            if self._has_twitter_credentials():
-                self.twitter_fetcher = TwitterFetcher(twitter_config)
-                self.logger.info("Twitter fetcher initialized")
-            else:
-                self.logger.warning("Twitter credentials not found - Twitter fetching disabled")
+            twitter_fetcher = TwitterFetcher(twitter_config)
+            self.logger.info("Twitter fetcher initialized")
+            return twitter_fetcher
             
-            # Initialize Reddit fetcher
-            reddit_config = self.config.get('reddit', {})
-            reddit_config.update(self.config.get('scraping', {}))
+        except Exception as e:
+            self.logger.error(f"Error initializing Twitter fetcher: {e}")
+            raise
+    
+    @cached_property
+    def reddit_fetcher(self) -> Optional[RedditFetcher]:
+        """Reddit fetcher, or None when credentials are missing"""
+        if not self._has_reddit_credentials():
+            self.logger.warning("Reddit credentials not found - Reddit fetching disabled")
+            return None
+        
+        try:
+            # Layer the shared scraping settings under the Reddit section
+            reddit_config = ChainMap(self.config.get('reddit', {}), self.config.get('scraping', {}))
             
-            if self._has_reddit_credentials():
-                self.reddit_fetcher = RedditFetcher(reddit_config)
-                self.logger.info("Reddit fetcher initialized")
-            else:
-                self.logger.warning("Reddit credentials not found - Reddit fetching disabled")
+            reddit_fetcher = RedditFetcher(reddit_config)
+            self.logger.info("Reddit fetcher initialized")
+            return reddit_fetcher
             
-            # Initialize hype scorer
+        except Exception as e:
+            self.logger.error(f"Error initializing Reddit fetcher: {e}")
+            raise
+    
+    @cached_property
+    def hype_scorer(self) -> HypeScorer:
+        """Hype scorer built from the scoring configuration"""
+        try:
             scoring_config = self.config.get('scoring', {})
-            self.hype_scorer = HypeScorer(scoring_config)
+            hype_scorer = HypeScorer(scoring_config)
             self.logger.info("Hype scorer initialized")
+            return hype_scorer
             
         except Exception as e:
-            self.logger.error(f"Error initializing components: {e}")
+            self.logger.error(f"Error initializing hype scorer: {e}")
             raise
     
+    def close(self) -> None:
+        """Release the resources held by any fetchers that were built"""
+        for name in ('twitter_fetcher', 'reddit_fetcher'):
+            fetcher = self.__dict__.get(name)
+            if fetcher is not None:
+                fetcher.close()
+    
     def _has_twitter_credentials(self) -> bool:
         """Check if Twitter credentials are available"""
         twitter_config = self.config.get('twitter', {})
@@ -85,29 +120,36 @@ class HypeFinder:
         
         all_posts = []
         
-        # Fetch from Twitter
+        # Select the fetchers to run
+        fetchers = {}
         if 'twitter' in sources and self.twitter_fetcher:
-            try:
-                twitter_posts = self.twitter_fetcher.get_standardized_posts()
-                all_posts.extend(twitter_posts)
-                self.logger.info(f"Fetched {len(twitter_posts)} Twitter posts")
-            except Exception as e:
-                self.logger.error(f"Error fetching Twitter data: {e}")
-        
-        # Fetch from Reddit
+            fetchers['Twitter'] = self.twitter_fetcher
         if 'reddit' in sources and self.reddit_fetcher:
-            try:
-                reddit_posts = self.reddit_fetcher.get_standardized_posts()
-                all_posts.extend(reddit_posts)
-                self.logger.info(f"Fetched {len(reddit_posts)} Reddit posts")
-            except Exception as e:
-                self.logger.error(f"Error fetching Reddit data: {e}")
+            fetchers['Reddit'] = self.reddit_fetcher
+        
+        # Fetch from all sources concurrently - the API clients block on
+        # network I/O, so the scan takes as long as the slowest source
+        # rather than the sum of all of them
+        if fetchers:
+            with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+                futures = {
+                    name: executor.submit(fetcher.get_standardized_posts)
+                    for name, fetcher in fetchers.items()
+                }
+        
+            for name, future in futures.items():
+                try:
+                    source_posts = future.result()
+                    all_posts.extend(source_posts)
+                    self.logger.info("Fetched %d %s posts", len(source_posts), name)
+                except Exception as e:
+                    self.logger.error(f"Error fetching {name} data: {e}")
         
         if not all_posts:
             self.logger.warning("No posts fetched from any source")
             return []
         
-        self.logger.info(f"Total posts collected: {len(all_posts)}")
+        self.logger.info("Total posts collected: %d", len(all_posts))
         
         # Calculate hype scores
         try:
@@ -116,8 +158,8 @@ class HypeFinder:
             
             # Save to history if requested
             if save_history and results:
-                for result in results:
-                    history_entry = {
+                history_entries = [
+                    {
                         'timestamp': result['timestamp'],
                         'ticker': result['ticker'],
                         'mentions': result['mention_count'],
@@ -125,7 +167,10 @@ class HypeFinder:
                         'hype_score': result['hype_score'],
                         'rank': result['rank']
                     }
-                    append_to_history(history_entry)
+                    for result in results
+                ]
+                append_to_history(history_entries,
+                                  self.config.get('output', {}).get('history_file', 'hype_history.csv'))
             
             return results
             
@@ -146,14 +191,14 @@ def cli(ctx, verbose, config_file):
     
     # Update log level if verbose
     if verbose:
-        config.config['output']['log_level'] = 'DEBUG'
+        config.set('output.log_level', 'DEBUG')
     
     # Load additional config file if specified
     if config_file and os.path.exists(config_file):
         try:
-            with open(config_file, 'r') as f:
-                file_config = json.load(f)
-                config.config.update(file_config)
+            with open(config_file, 'rb') as f:
+                file_config = orjson.loads(f.read())
+                config.update(file_config)
             click.echo(f"Loaded configuration from {config_file}")
         except Exception as e:
             click.echo(f"Error loading config file: {e}", err=True)
@@ -179,14 +224,15 @@ def scan(ctx, sources, top, output, output_file, min_mentions, explain):
     
     # Update config with command line options
     if top:
-        config.config['scoring']['top_n_tickers'] = top
+        config.set('scoring.top_n_tickers', top)
     if min_mentions:
-        config.config['scoring']['min_mentions'] = min_mentions
+        config.set('scoring.min_mentions', min_mentions)
     if output:
-        config.config['output']['format'] = output
+        config.set('output.format', output)
     if output_file:
-        config.config['output']['output_file'] = output_file
+        config.set('output.output_file', output_file)
     
+    app = None
     try:
         # Initialize HypeFinder
         app = HypeFinder(config.config)
@@ -202,7 +248,7 @@ def scan(ctx, sources, top, output, output_file, min_mentions, explain):
         output_format = config.get('output.format', 'console')
         
         if output_format in ['console', 'both']:
-            display_console_results(results, explain)
+            display_console_results(results, explain, app.hype_scorer)
         
         if output_format in ['csv', 'both']:
             csv_file = config.get('output.output_file', 'hype_results.csv')
@@ -216,6 +262,9 @@ def scan(ctx, sources, top, output, output_file, min_mentions, explain):
     except Exception as e:
         click.echo(f"Error during scan: {e}", err=True)
         sys.exit(1)
+    finally:
+        if app is not None:
+            app.close()
 
 @cli.command()
 @click.option('--interval', '-i', default=60, type=int, help='Scan interval in minutes')
@@ -226,13 +275,13 @@ def scan(ctx, sources, top, output, output_file, min_mentions, explain):
 def schedule(ctx, interval, sources, duration):
     """Run scheduled scans at regular intervals"""
     
-    import schedule
     import time
     
     click.echo(f"Starting scheduled scans every {interval} minutes")
     if duration:
         click.echo(f"Will run for {duration} hours")
     
+    app = None
     try:
         app = HypeFinder(config.config)
         
@@ -259,30 +308,36 @@ def schedule(ctx, interval, sources, duration):
             else:
                 click.echo("No results found in this scan")
         
-        # Schedule the scan
-        schedule.every(interval).minutes.do(run_scan)
+        # Scans fire on a fixed monotonic cadence measured from the first one
+        interval_seconds = interval * 60
+        next_run = time.monotonic()
         
         # Run initial scan
         run_scan()
         
-        start_time = datetime.now()
+        stop_time = time.monotonic() + duration * 3600 if duration else None
         
-        # Keep running
+        # Keep running - sleep straight through to the next scan (or the
+        # duration limit) instead of polling
         while True:
-            schedule.run_pending()
-            time.sleep(30)  # Check every 30 seconds
+            next_run = max(next_run + interval_seconds, time.monotonic())
+            wake_time = min(next_run, stop_time) if stop_time else next_run
+            time.sleep(max(0.0, wake_time - time.monotonic()))
             
             # Check duration limit
-            if duration:
-                elapsed_hours = (datetime.now() - start_time).total_seconds() / 3600
-                if elapsed_hours >= duration:
-                    click.echo(f"\nReached duration limit of {duration} hours. Stopping.")
-                    break
+            if stop_time and time.monotonic() >= stop_time:
+                click.echo(f"\nReached duration limit of {duration} hours. Stopping.")
+                break
+            
+            run_scan()
     
     except KeyboardInterrupt:
         click.echo("\nScheduled scanning stopped by user")
     except Exception as e:
         click.echo(f"Error in scheduled mode: {e}", err=True)
+    finally:
+        if app is not None:
+            app.close()
 
 @cli.command()
 @click.option('--show-credentials', is_flag=True, help='Show credential validation status')
@@ -300,24 +355,20 @@ def status(ctx, show_credentials):
     click.echo(f"Min Mentions: {config.get('scoring.min_mentions', 5)}")
     click.echo(f"Output Format: {config.get('output.format', 'console')}")
     
+    credentials = config.validate_api_credentials()
+    
     if show_credentials:
         click.echo("\nAPI Credentials Status:")
-        credentials = config.validate_api_credentials()
         for service, valid in credentials.items():
             status = "✓ Valid" if valid else "✗ Missing/Invalid"
             click.echo(f"  {service.title()}: {status}")
     
-    # Test component initialization
+    # Component availability - checked from the credentials alone, building
+    # the fetchers would connect to each API just to print this table
     click.echo("\nComponent Status:")
-    try:
-        app = HypeFinder(config.config)
-        
-        click.echo(f"  Twitter Fetcher: {'✓ Ready' if app.twitter_fetcher else '✗ Disabled'}")
-        click.echo(f"  Reddit Fetcher: {'✓ Ready' if app.reddit_fetcher else '✗ Disabled'}")
-        click.echo(f"  Hype Scorer: {'✓ Ready' if app.hype_scorer else '✗ Error'}")
-        
-    except Exception as e:
-        click.echo(f"  Error initializing components: {e}")
+    click.echo(f"  Twitter Fetcher: {'✓ Ready' if credentials['twitter'] else '✗ Disabled'}")
+    click.echo(f"  Reddit Fetcher: {'✓ Ready' if credentials['reddit'] else '✗ Disabled'}")
+    click.echo("  Hype Scorer: ✓ Ready")
 
 @cli.command()
 @click.option('--create-tickers', is_flag=True, help='Create sample ticker list file')
@@ -347,77 +398,109 @@ def setup(ctx, create_tickers, create_env):
         click.echo("  • Twitter Bearer Token (apply at developer.twitter.com)")
         click.echo("  • Reddit Client ID & Secret (create app at reddit.com/prefs/apps)")
 
-def display_console_results(results: List[Dict[str, Any]], explain: bool = False):
+def run_scan(sources: List[str] = None, top_n: Optional[int] = None, min_mentions: Optional[int] = None,
+             output_format: Optional[str] = None, base_dir: Optional[str] = None) -> Dict[str, Any]:
+    """Run a single scan in-process and return the results with their scoring summary
+    
+    Relative paths to the ticker list, the history file and the results CSV are resolved
+    against base_dir, or against the working directory when it is not given.
+    """
+    def resolve(path: str) -> str:
+        return os.path.join(base_dir, path) if base_dir else path
+    
+    # Apply the overrides to copies so the shared configuration is left untouched
+    scoring_config = config.get('scoring', {})
+    if top_n:
+        scoring_config['top_n_tickers'] = top_n
+    if min_mentions:
+        scoring_config['min_mentions'] = min_mentions
+    scoring_config['ticker_file'] = resolve(scoring_config.get('ticker_file', 'tickers.csv'))
+    
+    output_config = config.get('output', {})
+    output_config['history_file'] = resolve(output_config.get('history_file', 'hype_history.csv'))
+    output_config['output_file'] = resolve(output_config.get('output_file', 'hype_results.csv'))
+    
+    app = HypeFinder({**config.config, 'scoring': scoring_config, 'output': output_config})
+    try:
+        results = app.scan(sources=sources)
+        
+        output_format = output_format or output_config.get('format', 'console')
+        if results and output_format in ['csv', 'both']:
+            save_results_to_csv(results, output_config['output_file'])
+        
+        return {
+            'results': results,
+            'summary': app.hype_scorer.get_scoring_summary(results)
+        }
+    finally:
+        # Each call builds its own fetchers, so release their worker threads here
+        app.close()
+
+def display_console_results(results: List[Dict[str, Any]], explain: bool = False,
+                            scorer: Optional[HypeScorer] = None):
     """Display results to console in formatted table"""
     if not results:
         return
     
-    click.echo(f"\n🔥 Top {len(results)} Trending Tickers")
-    click.echo("=" * 80)
+    # Explanations only need the scoring weights - build a scorer once if
+    # the caller did not pass the one used for the scan
+    if explain and scorer is None:
+        scorer = HypeScorer(config.get('scoring', {}))
     
-    # Header
-    header = f"{'Rank':<4} {'Ticker':<8} {'Hype':<8} {'Volume':<8} {'Sentiment':<10} {'Mentions':<8} {'Platforms':<12}"
-    click.echo(header)
-    click.echo("-" * 80)
+    # Build the whole table and write it with a single echo
+    lines = [
+        f"\n🔥 Top {len(results)} Trending Tickers",
+        "=" * 80,
+        f"{'Rank':<4} {'Ticker':<8} {'Hype':<8} {'Volume':<8} {'Sentiment':<10} {'Mentions':<8} {'Platforms':<12}",
+        "-" * 80
+    ]
     
     # Results
     for result in results:
         platforms_str = ','.join(result['platforms'])[:11]
         
-        row = (f"{result['rank']:<4} "
-               f"${result['ticker']:<7} "
-               f"{result['hype_score']:<8.3f} "
-               f"{result['volume_score']:<8.3f} "
-               f"{result['sentiment_score']:<10.3f} "
-               f"{result['mention_count']:<8} "
-               f"{platforms_str:<12}")
-        
-        click.echo(row)
+        lines.append(f"{result['rank']:<4} "
+                     f"${result['ticker']:<7} "
+                     f"{result['hype_score']:<8.3f} "
+                     f"{result['volume_score']:<8.3f} "
+                     f"{result['sentiment_score']:<10.3f} "
+                     f"{result['mention_count']:<8} "
+                     f"{platforms_str:<12}")
         
         # Show explanation if requested
         if explain and result['rank'] <= 3:  # Only explain top 3
-            explanation = HypeScorer(config.config.get('scoring', {})).explain_score(
-                result['ticker'], result
-            )
-            click.echo(f"\n{explanation}\n")
+            explanation = scorer.explain_score(result['ticker'], result)
+            lines.append(f"\n{explanation}\n")
+    
+    click.echo('\n'.join(lines))
 
 def display_summary(summary: Dict[str, Any]):
     """Display scan summary"""
-    click.echo(f"\n📊 Scan Summary")
-    click.echo("-" * 30)
-    click.echo(f"Tickers analyzed: {summary['total_tickers']}")
-    click.echo(f"Total mentions: {summary['total_mentions']}")
-    click.echo(f"Average hype score: {summary['avg_hype_score']:.3f}")
+    lines = [
+        f"\n📊 Scan Summary",
+        "-" * 30,
+        f"Tickers analyzed: {summary['total_tickers']}",
+        f"Total mentions: {summary['total_mentions']}",
+        f"Average hype score: {summary['avg_hype_score']:.3f}"
+    ]
     
     if summary.get('top_ticker'):
-        click.echo(f"Top ticker: ${summary['top_ticker']} ({summary['top_hype_score']:.3f})")
+        lines.append(f"Top ticker: ${summary['top_ticker']} ({summary['top_hype_score']:.3f})")
     
-    click.echo(f"Scan completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    lines.append(f"Scan completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    click.echo('\n'.join(lines))
 
 def save_results_to_csv(results: List[Dict[str, Any]], filename: str):
     """Save results to CSV file"""
     if not results:
         return
     
-    # Flatten results for CSV
-    csv_data = []
-    for result in results:
-        csv_row = {
-            'rank': result['rank'],
-            'ticker': result['ticker'],
-            'hype_score': round(result['hype_score'], 4),
-            'volume_score': round(result['volume_score'], 4),
-            'sentiment_score': round(result['sentiment_score'], 4),
-            'sentiment_confidence': round(result['sentiment_confidence'], 4),
-            'mention_count': result['mention_count'],
-            'platforms': ','.join(result['platforms']),
-            'platform_count': result['platform_count'],
-            'sentiment_trend': result['sentiment_trend'],
-            'timestamp': result['timestamp']
-        }
-        csv_data.append(csv_row)
+    # Build the flattened table column-wise instead of row dict by row dict
+    df = pd.DataFrame(results, columns=CSV_RESULT_COLUMNS)
+    df[CSV_ROUNDED_COLUMNS] = df[CSV_ROUNDED_COLUMNS].round(4)
+    df['platforms'] = df['platforms'].str.join(',')
     
-    save_to_csv(csv_data, filename)
+    df.to_csv(filename, index=False)
 
 def main():
     """Main entry point"""
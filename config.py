@@ -1,7 +1,8 @@
+import copy
 import os
 from dotenv import load_dotenv
-from typing import Dict, Any
-import json
+from typing import Dict, Any, Optional
+import orjson
 
 # Load environment variables from .env file
 load_dotenv()
@@ -10,9 +11,30 @@ class Config:
     """Configuration manager for HypeFinder"""
     
     def __init__(self):
+        self._lookup_cache: Dict[str, Any] = {}
         self.config = self._load_config()
     
-    def _load_config(self) -> Dict[str, Any]:
+    def reload(self, config_file: Optional[str] = None) -> None:
+        """Reload the configuration from the environment and the given JSON config file"""
+        self.config = self._load_config(config_file)
+    
+    @property
+    def config(self) -> Dict[str, Any]:
+        return self._config
+    
+    @config.setter
+    def config(self, value: Dict[str, Any]) -> None:
+        self._config = value
+        self._on_change()
+    
+    def _on_change(self) -> None:
+        """Drop memoized lookups and recompute derived flags after a config change"""
+        self._lookup_cache.clear()
+        self.twitter_ok = bool(self.get('twitter.bearer_token') or 
+                               (self.get('twitter.api_key') and self.get('twitter.api_secret')))
+        self.reddit_ok = bool(self.get('reddit.client_id') and self.get('reddit.client_secret'))
+    
+    def _load_config(self, config_file: Optional[str] = None) -> Dict[str, Any]:
         """Load configuration from environment and config files"""
         config = {
             # Twitter API Configuration
@@ -57,16 +79,23 @@ class Config:
         }
         
         # Load additional config from JSON file if exists
-        config_file = os.getenv('CONFIG_FILE', 'config.json')
+        config_file = config_file or os.getenv('CONFIG_FILE', 'config.json')
         if os.path.exists(config_file):
-            with open(config_file, 'r') as f:
-                file_config = json.load(f)
+            with open(config_file, 'rb') as f:
+                file_config = orjson.loads(f.read())
                 config.update(file_config)
         
         return config
     
     def get(self, key: str, default: Any = None) -> Any:
-        """Get configuration value by dot notation (e.g., 'twitter.api_key')"""
+        """Get configuration value by dot notation (e.g., 'twitter.api_key')
+        
+        Sections and lists are returned as copies, so changing them never affects the
+        configuration; use set() or update() for that.
+        """
+        if key in self._lookup_cache:
+            return self._lookup_cache[key]
+        
         keys = key.split('.')
         value = self.config
         
@@ -76,16 +105,35 @@ class Config:
             else:
                 return default
         
+        # Only leaf values are memoized; containers are copied on every call
+        if isinstance(value, (dict, list)):
+            return copy.deepcopy(value)
+        
+        self._lookup_cache[key] = value
         return value
     
+    def set(self, key: str, value: Any) -> None:
+        """Set configuration value by dot notation, creating sections as needed"""
+        *sections, leaf = key.split('.')
+        target = self.config
+        
+        for k in sections:
+            target = target.setdefault(k, {})
+        
+        target[leaf] = value
+        self._on_change()
+    
+    def update(self, values: Dict[str, Any]) -> None:
+        """Merge top-level sections (e.g. from a JSON config file) into the configuration"""
+        self.config.update(values)
+        self._on_change()
+    
     def validate_api_credentials(self) -> Dict[str, bool]:
         """Validate that required API credentials are present"""
-        validation = {
-            'twitter': bool(self.get('twitter.bearer_token') or 
-                          (self.get('twitter.api_key') and self.get('twitter.api_secret'))),
-            'reddit': bool(self.get('reddit.client_id') and self.get('reddit.client_secret'))
+        return {
+            'twitter': self.twitter_ok,
+            'reddit': self.reddit_ok
         }
-        return validation
 
 # Global config instance
 config = Config() 
\ No newline at end of file
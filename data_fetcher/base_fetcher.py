@@ -1,17 +1,86 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+import atexit
+import re
+import threading
 import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
 import requests
+from requests.adapters import HTTPAdapter
 from utils.logger import setup_logger
 
+def _create_shared_session() -> requests.Session:
+    """Create the keep-alive connection pool shared by all fetchers"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+# Process-wide session so repeated scans reuse open TCP/TLS connections
+_SHARED_SESSION = _create_shared_session()
+atexit.register(_SHARED_SESSION.close)
+
+def create_pooled_session() -> requests.Session:
+    """Create a session with its own headers and cookies on the shared connection pool"""
+    # For API clients (e.g. praw) that set headers on the session they are given,
+    # so those headers never leak into requests made through _SHARED_SESSION
+    session = requests.Session()
+    for prefix, adapter in _SHARED_SESSION.adapters.items():
+        session.mount(prefix, adapter)
+    return session
+
+# Matches http(s):// and bare www. links in a single pass
+_URL_RE = re.compile(r'(?:https?://|www\.)\S+')
+
+class TokenBucket:
+    """Thread-safe token bucket that also honours server Retry-After back-off"""
+    
+    def __init__(self, rate_per_minute: float, capacity: Optional[int] = None):
+        self.rate = rate_per_minute / 60.0  # Tokens per second
+        self.capacity = capacity or max(1, int(rate_per_minute))
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Block the calling thread until a request may be sent"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                
+                if now >= self.blocked_until and self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                
+                wait = max(self.blocked_until - now, (1.0 - self.tokens) / self.rate)
+            
+            time.sleep(wait)
+    
+    def block_for(self, seconds: float) -> None:
+        """Hold back every caller of this bucket for the given number of seconds"""
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+# One bucket per API host, shared by every fetcher that calls it
+_RATE_LIMITERS: Dict[str, TokenBucket] = {}
+_RATE_LIMITERS_LOCK = threading.Lock()
+
 class BaseFetcher(ABC):
     """Base class for data fetchers with common functionality"""
     
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.logger = setup_logger(f'{self.__class__.__name__}')
-        self.session = requests.Session()
-        self.session.timeout = config.get('timeout', 30)
+        self.session = _SHARED_SESSION
+        self.timeout = config.get('timeout', 30)
+        
+        # Validated responses keyed by (url, params) for conditional requests
+        self._response_cache: Dict[Tuple[str, Tuple], requests.Response] = {}
     
     @abstractmethod
     def fetch_data(self) -> List[Dict[str, Any]]:
@@ -19,8 +88,12 @@ class BaseFetcher(ABC):
         pass
     
     @abstractmethod
-    def parse_posts(self, raw_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Parse raw data into standardized post format"""
+    def parse_posts(self, raw_data: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Parse raw data into standardized post format, yielding posts one at a time"""
+        pass
+    
+    def close(self) -> None:
+        """Release resources held by the fetcher (nothing by default)"""
         pass
     
     def rate_limit_sleep(self, delay: Optional[int] = None) -> None:
@@ -38,32 +111,74 @@ class BaseFetcher(ABC):
         if not text:
             return ""
         
-        # Remove excessive whitespace
+        # Remove excessive whitespace, then URLs
         text = ' '.join(text.split())
-        
-        # Remove URLs
-        import re
-        text = re.sub(r'http[s]?://\S+', '', text)
-        text = re.sub(r'www\.\S+', '', text)
+        text = _URL_RE.sub('', text)
         
         return text.strip()
     
+    def _get_rate_limiter(self, url: str) -> TokenBucket:
+        """Get the shared rate limiter for the host of the given URL"""
+        host = urlparse(url).netloc
+        
+        with _RATE_LIMITERS_LOCK:
+            if host not in _RATE_LIMITERS:
+                _RATE_LIMITERS[host] = TokenBucket(self.config.get('requests_per_minute', 60))
+            return _RATE_LIMITERS[host]
+    
+    def _parse_retry_after(self, value: Optional[str], default: float) -> float:
+        """Parse a Retry-After header given either as seconds or as an HTTP date"""
+        if not value:
+            return default
+        
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        
+        try:
+            retry_at = parsedate_to_datetime(value)
+            return max(0.0, retry_at.timestamp() - time.time())
+        except (TypeError, ValueError):
+            return default
+    
     def make_request(self, url: str, headers: Optional[Dict[str, str]] = None, 
                      params: Optional[Dict[str, Any]] = None) -> Optional[requests.Response]:
         """Make HTTP request with error handling and retries"""
         max_retries = 3
         retry_delay = 2
         
+        # Revalidate a previously seen response instead of re-downloading it
+        cache_key = (url, tuple(sorted((k, str(v)) for k, v in (params or {}).items())))
+        cached = self._response_cache.get(cache_key)
+        request_headers = dict(headers or {})
+        if cached is not None:
+            if cached.headers.get('ETag'):
+                request_headers['If-None-Match'] = cached.headers['ETag']
+            if cached.headers.get('Last-Modified'):
+                request_headers['If-Modified-Since'] = cached.headers['Last-Modified']
+        
+        # Requests to the same host share one budget; a 429 only holds back
+        # callers of that host, other fetcher threads keep running
+        rate_limiter = self._get_rate_limiter(url)
+        
         for attempt in range(max_retries):
             try:
-                response = self.session.get(url, headers=headers, params=params)
+                rate_limiter.acquire()
+                response = self.session.get(url, headers=request_headers, params=params,
+                                            timeout=self.timeout)
                 
                 if response.status_code == 200:
+                    if response.headers.get('ETag') or response.headers.get('Last-Modified'):
+                        self._response_cache[cache_key] = response
                     return response
+                elif response.status_code == 304 and cached is not None:  # Not modified
+                    return cached
                 elif response.status_code == 429:  # Rate limited
-                    retry_after = int(response.headers.get('Retry-After', retry_delay * (attempt + 1)))
-                    self.logger.warning(f"Rate limited. Waiting {retry_after} seconds...")
-                    time.sleep(retry_after)
+                    retry_after = self._parse_retry_after(response.headers.get('Retry-After'),
+                                                          retry_delay * (attempt + 1))
+                    self.logger.warning(f"Rate limited. Waiting {retry_after:.0f} seconds...")
+                    rate_limiter.block_for(retry_after)
                     continue
                 else:
                     self.logger.warning(f"HTTP {response.status_code}: {response.text}")
@@ -79,15 +194,15 @@ class BaseFetcher(ABC):
     def get_standardized_posts(self) -> List[Dict[str, Any]]:
         """Main method to fetch and parse data into standardized format"""
         try:
-            self.logger.info(f"Fetching data from {self.__class__.__name__}")
+            self.logger.info("Fetching data from %s", self.__class__.__name__)
             raw_data = self.fetch_data()
             
             if not raw_data:
                 self.logger.warning("No data fetched")
                 return []
             
-            posts = self.parse_posts(raw_data)
-            self.logger.info(f"Successfully parsed {len(posts)} posts")
+            posts = list(self.parse_posts(raw_data))
+            self.logger.info("Successfully parsed %d posts", len(posts))
             return posts
             
         except Exception as e:
@@ -1,7 +1,34 @@
+import heapq
+import itertools
+import math
+import numbers
+import numpy as np
 import praw
-from typing import List, Dict, Any, Optional
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from praw.models import MoreComments
+from prawcore.requestor import Requestor
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from datetime import datetime, timedelta
-from .base_fetcher import BaseFetcher
+from .base_fetcher import BaseFetcher, TokenBucket, create_pooled_session
+
+# Comments at or below this many characters carry too little text to keep
+MIN_COMMENT_LENGTH = 20
+
+# Host every praw API call goes to; its rate limiter is shared by all clients
+REDDIT_API_URL = 'https://oauth.reddit.com'
+
+class _RateLimitedRequestor(Requestor):
+    """prawcore requestor that takes a token from a shared bucket before each request"""
+    
+    def __init__(self, *args, rate_limiter: TokenBucket, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._rate_limiter = rate_limiter
+    
+    def request(self, *args, **kwargs):
+        self._rate_limiter.acquire()
+        return super().request(*args, **kwargs)
 
 class RedditFetcher(BaseFetcher):
     """Fetches posts from relevant financial subreddits"""
@@ -33,23 +60,74 @@ class RedditFetcher(BaseFetcher):
             'squeeze', 'pump', 'dump', 'hodl', 'dip', 'rally', 'ath',
             'resistance', 'support', 'breakout', 'earnings', 'dd'
         ]
+        
+        # Terms that indicate crypto discussion
+        self.crypto_terms = ['crypto', 'bitcoin', 'btc', 'eth', 'ethereum', 'altcoin', 'defi']
+        
+        # All relevance markers ($TICKER cashtags, keywords, crypto terms) as one
+        # alternation so each post is scanned once instead of once per keyword;
+        # the cashtag form matches TickerParser's, so bare prices like $5 don't count
+        self._relevance_re = re.compile('|'.join(
+            [r'\$[A-Z]{1,5}\b'] + [re.escape(term) for term in self.financial_keywords + self.crypto_terms]
+        ), re.IGNORECASE)
+        
+        # Subreddits are fetched concurrently by a worker pool that lives until close();
+        # praw instances are not thread safe, so each worker keeps its own client
+        self.max_workers = max(1, min(len(self.subreddits), config.get('max_concurrent_requests', 4)))
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                            thread_name_prefix='RedditFetcher')
+        self._worker_clients = threading.local()
+    
+    def close(self) -> None:
+        """Shut down the worker pool used for concurrent subreddit fetches"""
+        self._executor.shutdown(wait=True)
+    
+    def _create_reddit_client(self) -> praw.Reddit:
+        """Create a Reddit API client from the configured credentials"""
+        # praw overwrites the User-Agent of the session it is given, so each client
+        # gets its own session on the shared connection pool. Each client also has
+        # its own prawcore throttle, so the worker clients additionally share one
+        # token bucket for the Reddit API host
+        return praw.Reddit(
+            client_id=self.config.get('client_id'),
+            client_secret=self.config.get('client_secret'),
+            user_agent=self.config.get('user_agent', 'HypeFinder/1.0'),
+            requestor_class=_RateLimitedRequestor,
+            requestor_kwargs={
+                'session': create_pooled_session(),
+                'rate_limiter': self._get_rate_limiter(REDDIT_API_URL)
+            }
+        )
+    
+    def _get_worker_client(self) -> praw.Reddit:
+        """Get the Reddit client owned by the calling worker thread"""
+        client = getattr(self._worker_clients, 'client', None)
+        if client is None:
+            client = self._create_reddit_client()
+            self._worker_clients.client = client
+        return client
+    
+    def _get_worker_subreddit(self, subreddit_name: str):
+        """Get the calling thread's Subreddit object, reusing it across fetches"""
+        subreddits = getattr(self._worker_clients, 'subreddits', None)
+        if subreddits is None:
+            subreddits = self._worker_clients.subreddits = {}
+        subreddit = subreddits.get(subreddit_name)
+        if subreddit is None:
+            subreddit = subreddits[subreddit_name] = self._get_worker_client().subreddit(subreddit_name)
+        return subreddit
     
     def _setup_reddit_client(self) -> Optional[praw.Reddit]:
         """Initialize Reddit API client"""
         try:
             client_id = self.config.get('client_id')
             client_secret = self.config.get('client_secret')
-            user_agent = self.config.get('user_agent', 'HypeFinder/1.0')
             
             if not all([client_id, client_secret]):
                 self.logger.error("Missing Reddit API credentials")
                 return None
             
-            reddit = praw.Reddit(
-                client_id=client_id,
-                client_secret=client_secret,
-                user_agent=user_agent
-            )
+            reddit = self._create_reddit_client()
             
             # Test connection
             try:
@@ -74,54 +152,72 @@ class RedditFetcher(BaseFetcher):
         all_posts = []
         max_posts_per_subreddit = self.config.get('max_posts_per_subreddit', 100)
         
-        for subreddit_name in self.subreddits:
-            try:
-                self.logger.info(f"Fetching posts from r/{subreddit_name}")
-                subreddit_posts = self._fetch_subreddit_posts(
-                    subreddit_name, 
-                    max_posts_per_subreddit
-                )
-                all_posts.extend(subreddit_posts)
-                
-                # Rate limiting
-                self.rate_limit_sleep()
-                
-            except Exception as e:
-                self.logger.warning(f"Error fetching from r/{subreddit_name}: {e}")
-                continue
+        # Fetch all subreddits concurrently; map() keeps the configured order
+        subreddit_results = self._executor.map(
+            lambda subreddit_name: self._fetch_subreddit_safely(subreddit_name, max_posts_per_subreddit),
+            self.subreddits
+        )
+        for subreddit_posts in subreddit_results:
+            all_posts.extend(subreddit_posts)
         
         self.logger.info(f"Fetched {len(all_posts)} total Reddit posts")
         return all_posts
     
+    def _fetch_subreddit_safely(self, subreddit_name: str, limit: int) -> List[Dict[str, Any]]:
+        """Fetch one subreddit on a worker thread, logging instead of raising"""
+        try:
+            self.logger.info(f"Fetching posts from r/{subreddit_name}")
+            subreddit_posts = self._fetch_subreddit_posts(subreddit_name, limit)
+            
+            # Rate limiting (per worker)
+            self.rate_limit_sleep()
+            
+            return subreddit_posts
+            
+        except Exception as e:
+            self.logger.warning(f"Error fetching from r/{subreddit_name}: {e}")
+            return []
+    
     def _fetch_subreddit_posts(self, subreddit_name: str, limit: int) -> List[Dict[str, Any]]:
         """Fetch posts from a specific subreddit"""
         posts = []
         
         try:
-            subreddit = self.reddit_client.subreddit(subreddit_name)
+            subreddit = self._get_worker_subreddit(subreddit_name)
             
-            # Get hot posts (most engagement recently)
-            hot_posts = list(subreddit.hot(limit=limit//2))
+            # Stream hot posts (most engagement recently) followed by new posts (most
+            # recent) straight from praw's lazy listings, without materializing them
+            listing = itertools.chain(subreddit.hot(limit=limit//2), subreddit.new(limit=limit//2))
             
-            # Get new posts (most recent)
-            new_posts = list(subreddit.new(limit=limit//2))
-            
-            # Combine and process posts
-            for post in hot_posts + new_posts:
+            # Combine and process posts; popular recent posts show up in both
+            # listings, so each id is only filtered and has its comments fetched once
+            seen_ids = set()
+            for post in listing:
+                if len(posts) >= limit:
+                    break
+                
+                if post.id in seen_ids:
+                    continue
+                seen_ids.add(post.id)
+                
                 try:
                     # Skip certain post types
                     if post.stickied or post.distinguished:
                         continue
                     
+                    # Read the text attributes once and reuse them below
+                    title = post.title or ''
+                    selftext = post.selftext or ''
+                    
                     # Filter for relevant content
-                    if not self._is_relevant_post(post):
+                    if not self._is_relevant_post(title, selftext):
                         continue
                     
                     post_data = {
                         'id': post.id,
-                        'title': post.title,
-                        'selftext': post.selftext,
-                        'author': str(post.author) if post.author else '[deleted]',
+                        'title': title,
+                        'selftext': selftext,
+                        'author': post.author.name if post.author else '[deleted]',
                         'created_utc': post.created_utc,
                         'score': post.score,
                         'upvote_ratio': post.upvote_ratio,
@@ -139,7 +235,7 @@ class RedditFetcher(BaseFetcher):
                     posts.append(post_data)
                     
                 except Exception as e:
-                    self.logger.debug(f"Error processing post {post.id}: {e}")
+                    self.logger.debug("Error processing post %s: %s", post.id, e)
                     continue
                     
         except Exception as e:
@@ -147,38 +243,29 @@ class RedditFetcher(BaseFetcher):
         
         return posts
     
-    def _is_relevant_post(self, post) -> bool:
-        """Check if post is relevant for financial analysis"""
-        # Combine title and self text for analysis
-        full_text = f"{post.title} {post.selftext}".lower()
-        
-        # Check for ticker symbols ($AAPL format)
-        if '$' in full_text:
-            return True
-        
-        # Check for financial keywords
-        for keyword in self.financial_keywords:
-            if keyword in full_text:
-                return True
-        
-        # Check for crypto mentions
-        crypto_terms = ['crypto', 'bitcoin', 'btc', 'eth', 'ethereum', 'altcoin', 'defi']
-        for term in crypto_terms:
-            if term in full_text:
-                return True
-        
-        return False
+    def _is_relevant_post(self, title: str, selftext: str) -> bool:
+        """Check if a post's title and self text are relevant for financial analysis"""
+        # Check for ticker symbols ($AAPL format), financial keywords and crypto mentions;
+        # the pattern ignores case, so title and self text are searched as they are
+        return (self._relevance_re.search(title) is not None or
+                self._relevance_re.search(selftext) is not None)
     
     def _get_top_comments(self, post, limit: int = 5) -> List[Dict[str, Any]]:
         """Get top comments from a post"""
         comments = []
         
         try:
-            # Replace "more comments" objects to get actual comments
-            post.comments.replace_more(limit=0)
+            # Have Reddit return the comment forest in "top" order so only the head of
+            # the top-level list is needed; "more comments" stubs are skipped instead
+            # of pruned from the whole tree with replace_more()
+            post.comment_sort = 'top'
+            top_level = [
+                comment for comment in itertools.islice(post.comments, limit * 4)
+                if not isinstance(comment, MoreComments)
+            ]
             
             # Get top-level comments sorted by score
-            top_comments = sorted(post.comments, key=lambda x: x.score, reverse=True)[:limit]
+            top_comments = heapq.nlargest(limit, top_level, key=lambda x: x.score)
             
             for comment in top_comments:
                 try:
@@ -189,27 +276,46 @@ class RedditFetcher(BaseFetcher):
                     comment_data = {
                         'id': comment.id,
                         'body': comment.body,
-                        'author': str(comment.author),
+                        'author': comment.author.name,
                         'score': comment.score,
                         'created_utc': comment.created_utc
                     }
                     comments.append(comment_data)
                     
                 except Exception as e:
-                    self.logger.debug(f"Error processing comment: {e}")
+                    self.logger.debug("Error processing comment: %s", e)
                     continue
                     
         except Exception as e:
-            self.logger.debug(f"Error fetching comments for post {post.id}: {e}")
+            self.logger.debug("Error fetching comments for post %s: %s", post.id, e)
         
         return comments
     
-    def parse_posts(self, raw_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _engagement_fields(self, post_data: Dict[str, Any]) -> Tuple[float, float, float]:
+        """score, upvote_ratio and num_comments as floats, all NaN if any of them is not a number"""
+        try:
+            fields = (post_data.get('score', 0), post_data.get('upvote_ratio', 0.5),
+                      post_data.get('num_comments', 0))
+            if all(isinstance(field, numbers.Real) for field in fields):
+                return tuple(float(field) for field in fields)
+        except AttributeError:
+            pass
+        
+        return math.nan, math.nan, math.nan
+    
+    def parse_posts(self, raw_data: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
         """Parse Reddit data into standardized format"""
-        parsed_posts = []
+        # Weighted engagement score for every post in one vectorized pass; posts with
+        # unusable engagement fields come out as NaN and are skipped one by one below
+        fields = np.array([self._engagement_fields(post_data) for post_data in raw_data],
+                          dtype=float).reshape(-1, 3)
+        engagement_scores = ((fields[:, 0] * fields[:, 1]) + (fields[:, 2] * 2)).tolist()
         
-        for post_data in raw_data:
+        for post_data, engagement_score in zip(raw_data, engagement_scores):
             try:
+                if math.isnan(engagement_score):
+                    raise ValueError("score, upvote_ratio and num_comments must be numbers")
+                
                 # Combine title and selftext for full content
                 title = post_data.get('title', '')
                 selftext = post_data.get('selftext', '')
@@ -221,14 +327,10 @@ class RedditFetcher(BaseFetcher):
                 if not cleaned_text:
                     continue
                 
-                # Calculate engagement score
                 score = post_data.get('score', 0)
                 num_comments = post_data.get('num_comments', 0)
                 upvote_ratio = post_data.get('upvote_ratio', 0.5)
                 
-                # Weighted engagement score
-                engagement_score = (score * upvote_ratio) + (num_comments * 2)
-                
                 # Convert timestamp
                 timestamp = None
                 if post_data.get('created_utc'):
@@ -252,8 +354,13 @@ class RedditFetcher(BaseFetcher):
                 # Add comments as separate posts
                 comments = post_data.get('top_comments', [])
                 for comment in comments:
-                    comment_text = self.clean_text(comment.get('body', ''))
-                    if comment_text and len(comment_text) > 20:  # Minimum comment length
+                    # Cleaning never lengthens text, so short bodies can be skipped uncleaned
+                    body = comment.get('body', '')
+                    if len(body) <= MIN_COMMENT_LENGTH:
+                        continue
+                    
+                    comment_text = self.clean_text(body)
+                    if comment_text and len(comment_text) > MIN_COMMENT_LENGTH:
                         comment_timestamp = None
                         if comment.get('created_utc'):
                             comment_timestamp = datetime.fromtimestamp(comment['created_utc']).isoformat()
@@ -269,15 +376,13 @@ class RedditFetcher(BaseFetcher):
                             'subreddit': post_data.get('subreddit', ''),
                             'parent_post_id': post_data.get('id', '')
                         }
-                        parsed_posts.append(comment_post)
+                        yield comment_post
                 
-                parsed_posts.append(parsed_post)
+                yield parsed_post
                 
             except Exception as e:
-                self.logger.debug(f"Error parsing Reddit post: {e}")
+                self.logger.debug("Error parsing Reddit post: %s", e)
                 continue
-        
-        return parsed_posts
     
     def search_specific_ticker(self, ticker: str, limit: int = 50) -> List[Dict[str, Any]]:
         """Search for posts mentioning a specific ticker across all subreddits"""
@@ -286,47 +391,63 @@ class RedditFetcher(BaseFetcher):
         
         all_posts = []
         search_query = f"${ticker}"
+        per_subreddit_limit = limit//len(self.subreddits)
         
-        for subreddit_name in self.subreddits:
-            try:
-                subreddit = self.reddit_client.subreddit(subreddit_name) 
-                
-                # Search within the subreddit
-                search_results = list(subreddit.search(
-                    search_query, 
-                    sort='hot',
-                    time_filter='week',
-                    limit=limit//len(self.subreddits)
-                ))
-                
-                for post in search_results:
-                    try:
-                        post_data = {
-                            'id': post.id,
-                            'title': post.title,
-                            'selftext': post.selftext,
-                            'author': str(post.author) if post.author else '[deleted]',
-                            'created_utc': post.created_utc,
-                            'score': post.score,
-                            'num_comments': post.num_comments,
-                            'subreddit': subreddit_name,
-                            'url': f"https://reddit.com{post.permalink}",
-                            'source': 'reddit',
-                            'top_comments': self._get_top_comments(post, limit=3)
-                        }
-                        all_posts.append(post_data)
-                        
-                    except Exception as e:
-                        self.logger.debug(f"Error processing search result: {e}")
-                        continue
-                
-                self.rate_limit_sleep()
-                
-            except Exception as e:
-                self.logger.warning(f"Error searching r/{subreddit_name} for {ticker}: {e}")
-                continue
+        # Search all subreddits concurrently on the shared worker pool
+        search_results = self._executor.map(
+            lambda subreddit_name: self._search_subreddit_safely(
+                subreddit_name, search_query, ticker, per_subreddit_limit),
+            self.subreddits
+        )
+        for subreddit_posts in search_results:
+            all_posts.extend(subreddit_posts)
         
-        return self.parse_posts(all_posts)
+        return list(self.parse_posts(all_posts))
+    
+    def _search_subreddit_safely(self, subreddit_name: str, search_query: str,
+                                 ticker: str, limit: int) -> List[Dict[str, Any]]:
+        """Search one subreddit on a worker thread, logging instead of raising"""
+        posts = []
+        
+        try:
+            subreddit = self._get_worker_subreddit(subreddit_name)
+            
+            # Search within the subreddit
+            search_results = list(subreddit.search(
+                search_query, 
+                sort='hot',
+                time_filter='week',
+                limit=limit
+            ))
+            
+            for post in search_results:
+                try:
+                    post_data = {
+                        'id': post.id,
+                        'title': post.title,
+                        'selftext': post.selftext,
+                        'author': post.author.name if post.author else '[deleted]',
+                        'created_utc': post.created_utc,
+                        'score': post.score,
+                        'num_comments': post.num_comments,
+                        'subreddit': subreddit_name,
+                        'url': f"https://reddit.com{post.permalink}",
+                        'source': 'reddit',
+                        'top_comments': self._get_top_comments(post, limit=3)
+                    }
+                    posts.append(post_data)
+                    
+                except Exception as e:
+                    self.logger.debug("Error processing search result: %s", e)
+                    continue
+            
+            # Rate limiting (per worker)
+            self.rate_limit_sleep()
+            
+        except Exception as e:
+            self.logger.warning(f"Error searching r/{subreddit_name} for {ticker}: {e}")
+        
+        return posts
     
     def get_subreddit_hot_tickers(self, subreddit_name: str = 'wallstreetbets', limit: int = 50) -> List[Dict[str, Any]]:
         """Get hot posts from a specific subreddit likely to contain tickers"""
@@ -334,18 +455,20 @@ class RedditFetcher(BaseFetcher):
             return []
         
         try:
-            subreddit = self.reddit_client.subreddit(subreddit_name)
+            subreddit = self._get_worker_subreddit(subreddit_name)
             hot_posts = list(subreddit.hot(limit=limit))
             
             # Filter for posts likely to contain ticker mentions
             relevant_posts = []
             for post in hot_posts:
-                if self._is_relevant_post(post):
+                title = post.title or ''
+                selftext = post.selftext or ''
+                if self._is_relevant_post(title, selftext):
                     post_data = {
                         'id': post.id,
-                        'title': post.title,
-                        'selftext': post.selftext,
-                        'author': str(post.author) if post.author else '[deleted]',
+                        'title': title,
+                        'selftext': selftext,
+                        'author': post.author.name if post.author else '[deleted]',
                         'created_utc': post.created_utc,
                         'score': post.score,
                         'num_comments': post.num_comments,
@@ -356,7 +479,7 @@ class RedditFetcher(BaseFetcher):
                     }
                     relevant_posts.append(post_data)
             
-            return self.parse_posts(relevant_posts)
+            return list(self.parse_posts(relevant_posts))
             
         except Exception as e:
             self.logger.error(f"Error fetching hot tickers from r/{subreddit_name}: {e}")
@@ -1,8 +1,12 @@
+import re
 import tweepy
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 from datetime import datetime, timedelta
 from .base_fetcher import BaseFetcher
 
+# Maximum query length accepted by the recent search endpoint
+MAX_QUERY_LENGTH = 512
+
 class TwitterFetcher(BaseFetcher):
     """Fetches trending tweets related to stocks and crypto"""
     
@@ -29,6 +33,11 @@ class TwitterFetcher(BaseFetcher):
             "rocket",
             "stonks"
         ]
+        
+        # Search query used by fetch_data: ticker prefix plus finance keywords,
+        # combined with OR operators, excluding retweets, English only
+        query_parts = ["$", "stock market", "crypto", "trading", "bullish", "bearish"]
+        self._base_query = " OR ".join([f'"{term}"' for term in query_parts]) + " -is:retweet lang:en"
     
     def _setup_twitter_client(self) -> Optional[tweepy.Client]:
         """Initialize Twitter API client"""
@@ -77,18 +86,7 @@ class TwitterFetcher(BaseFetcher):
         tweets_per_query = min(100, max_tweets)  # Twitter API limit
         
         # Search for tweets with financial keywords
-        query_parts = []
-        
-        # Add ticker symbol search
-        query_parts.append("$")
-        
-        # Add keyword searches
-        finance_keywords = ["stock market", "crypto", "trading", "bullish", "bearish"]
-        query_parts.extend(finance_keywords)
-        
-        # Combine with OR operators
-        query = " OR ".join([f'"{term}"' for term in query_parts])
-        query += " -is:retweet lang:en"  # Exclude retweets, English only
+        query = self._base_query
         
         try:
             self.logger.info(f"Searching Twitter with query: {query}")
@@ -135,10 +133,8 @@ class TwitterFetcher(BaseFetcher):
             self.logger.debug(f"Could not fetch trending topics: {e}")
             return []
     
-    def parse_posts(self, raw_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def parse_posts(self, raw_data: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
         """Parse Twitter data into standardized format"""
-        parsed_posts = []
-        
         for tweet_data in raw_data:
             try:
                 # Clean text content
@@ -165,13 +161,11 @@ class TwitterFetcher(BaseFetcher):
                     'url': f"https://twitter.com/i/status/{tweet_data.get('id', '')}"
                 }
                 
-                parsed_posts.append(parsed_post)
+                yield parsed_post
                 
             except Exception as e:
-                self.logger.debug(f"Error parsing tweet: {e}")
+                self.logger.debug("Error parsing tweet: %s", e)
                 continue
-        
-        return parsed_posts
     
     def search_specific_ticker(self, ticker: str, limit: int = 50) -> List[Dict[str, Any]]:
         """Search for tweets mentioning a specific ticker"""
@@ -199,8 +193,73 @@ class TwitterFetcher(BaseFetcher):
                 }
                 tweet_data.append(data)
             
-            return self.parse_posts(tweet_data)
+            return list(self.parse_posts(tweet_data))
             
         except Exception as e:
             self.logger.error(f"Error searching for ticker {ticker}: {e}")
-            return [] 
\ No newline at end of file
+            return []
+    
+    def search_multiple_tickers(self, tickers: List[str], limit: int = 50) -> Dict[str, List[Dict[str, Any]]]:
+        """Search for tweets mentioning any of several tickers, grouped per ticker"""
+        results = {ticker: [] for ticker in tickers}
+        if not self.api_client or not tickers:
+            return results
+        
+        query_suffix = " -is:retweet lang:en"
+        mention_pattern = re.compile(
+            r'\$(' + '|'.join(map(re.escape, tickers)) + r')\b', re.IGNORECASE
+        )
+        ticker_lookup = {ticker.upper(): ticker for ticker in tickers}
+        
+        # Pack as many tickers as fit into each OR query instead of one request per ticker
+        queries = []
+        query_terms = []
+        for ticker in tickers:
+            candidate = query_terms + [f"${ticker}"]
+            if query_terms and len(" OR ".join(candidate) + query_suffix) > MAX_QUERY_LENGTH:
+                queries.append(" OR ".join(query_terms) + query_suffix)
+                candidate = [f"${ticker}"]
+            query_terms = candidate
+        queries.append(" OR ".join(query_terms) + query_suffix)
+        
+        grouped_tweets = {ticker: [] for ticker in tickers}
+        seen_ids = set()
+        for query in queries:
+            try:
+                tweets = tweepy.Paginator(
+                    self.api_client.search_recent_tweets,
+                    query=query,
+                    max_results=min(100, max(10, limit)),
+                    tweet_fields=['created_at', 'public_metrics']
+                ).flatten(limit=limit)
+                
+                for tweet in tweets:
+                    # Tweets mentioning tickers from different queries come back more than once
+                    if tweet.id in seen_ids:
+                        continue
+                    seen_ids.add(tweet.id)
+                    
+                    data = {
+                        'id': tweet.id,
+                        'text': tweet.text,
+                        'created_at': tweet.created_at.isoformat() if tweet.created_at else None,
+                        'metrics': tweet.public_metrics if hasattr(tweet, 'public_metrics') else {},
+                        'source': 'twitter'
+                    }
+                    
+                    # A tweet counts towards every requested ticker it mentions
+                    mentioned = {match.upper() for match in mention_pattern.findall(tweet.text)}
+                    for symbol in mentioned:
+                        grouped_tweets[ticker_lookup[symbol]].append(data)
+                
+            except tweepy.TooManyRequests:
+                self.logger.warning("Twitter rate limit exceeded")
+                break
+            except Exception as e:
+                self.logger.error(f"Error searching for tickers with query {query}: {e}")
+                continue
+        
+        for ticker, tweet_data in grouped_tweets.items():
+            results[ticker] = list(self.parse_posts(tweet_data))
+        
+        return results
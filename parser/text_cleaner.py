@@ -1,7 +1,10 @@
 import re
+from functools import lru_cache
 from typing import List, Optional
 import html
 
+CLEAN_CACHE_SIZE = 65536
+
 class TextCleaner:
     """Utility class for cleaning and normalizing social media text"""
     
@@ -11,9 +14,13 @@ class TextCleaner:
         self.mention_pattern = re.compile(r'@\w+')
         self.hashtag_pattern = re.compile(r'#\w+')
         self.email_pattern = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
-        self.phone_pattern = re.compile(r'[\+]?[1-9]?[0-9]{7,14}')
+        # Standalone 7-15 digit runs only, so ids, digits inside words, $-prices
+        # and amounts with decimals are left alone
+        self.phone_pattern = re.compile(r'(?<![\w+.,$])\+?[0-9]{7,15}(?!\w|[.,][0-9])')
         self.excessive_whitespace = re.compile(r'\s+')
         self.multiple_punctuation = re.compile(r'[!?.]{3,}')
+        self.sentence_boundary = re.compile(r'[.!?]+')
+        self.ticker_pattern = re.compile(r'\$[A-Z]{1,5}\b')
         
         # Emoji pattern (basic)
         self.emoji_pattern = re.compile(
@@ -54,17 +61,40 @@ class TextCleaner:
             'brrrr': 'money printing',
             'guh': 'loss reaction',
         }
+        
+        # Noise words that don't add sentiment value
+        self.noise_words = [
+            'lol', 'lmao', 'omg', 'wtf', 'tbh', 'imo', 'imho', 'afaik',
+            'tldr', 'tl;dr', 'fyi', 'btw', 'idk', 'ngl', 'smh'
+        ]
+        
+        # Slang and noise words as single alternations so each text is scanned once
+        # (longest first, so a multi-word term wins over any term it starts with)
+        self.slang_pattern = re.compile(r'\b(' + '|'.join(
+            re.escape(slang) for slang in sorted(self.slang_replacements, key=len, reverse=True)
+        ) + r')\b')
+        self.noise_pattern = re.compile(r'\b(?:' + '|'.join(
+            re.escape(noise) for noise in sorted(self.noise_words, key=len, reverse=True)
+        ) + r')\b', re.IGNORECASE)
+        
+        # Cleaning depends only on the text, so repeated texts (retweets, crossposts,
+        # bot reposts) run the regex chain once
+        self._cached_clean_for_sentiment = lru_cache(maxsize=CLEAN_CACHE_SIZE)(self._clean_for_sentiment)
+    
+    def _strip_markup(self, text: str) -> str:
+        """Decode HTML entities and remove URLs, leaving whitespace as it is"""
+        # Decode HTML entities  
+        text = html.unescape(text)
+        
+        # Remove URLs
+        return self.url_pattern.sub('', text)
     
     def clean_basic(self, text: str) -> str:
         """Basic text cleaning - remove URLs, excessive whitespace"""
         if not text:
             return ""
         
-        # Decode HTML entities  
-        text = html.unescape(text)
-        
-        # Remove URLs
-        text = self.url_pattern.sub('', text)
+        text = self._strip_markup(text)
         
         # Remove excessive whitespace
         text = self.excessive_whitespace.sub(' ', text)
@@ -79,13 +109,14 @@ class TextCleaner:
         if not text:
             return ""
         
-        # Start with basic cleaning
-        text = self.clean_basic(text)
+        # Start with basic cleaning; none of the patterns below match whitespace,
+        # so it is normalized once at the end instead of here as well
+        text = self._strip_markup(text)
         
-        # Store ticker symbols to preserve them
-        tickers = []
+        # Store ticker symbols (without the $) to preserve them
+        tickers = set()
         if preserve_tickers:
-            tickers = re.findall(r'\$[A-Z]{1,5}\b', text.upper())
+            tickers = {ticker[1:] for ticker in self.ticker_pattern.findall(text.upper())}
         
         # Remove mentions (but not tickers)
         text = self.mention_pattern.sub('', text)
@@ -94,7 +125,7 @@ class TextCleaner:
         def hashtag_replacer(match):
             hashtag = match.group(0)
             tag_text = hashtag[1:]  # Remove #
-            if tag_text.upper() in [t[1:] for t in tickers]:  # If hashtag is a ticker
+            if tag_text.upper() in tickers:  # If hashtag is a ticker
                 return f"${tag_text.upper()}"
             return tag_text  # Keep text without #
         
@@ -139,41 +170,22 @@ class TextCleaner:
         if not text:
             return ""
         
-        text_lower = text.lower()
-        
-        for slang, replacement in self.slang_replacements.items():
-            # Use word boundaries to avoid partial matches
-            pattern = r'\b' + re.escape(slang) + r'\b'
-            text_lower = re.sub(pattern, replacement, text_lower)
-        
-        return text_lower
+        # Word boundaries in the pattern avoid partial matches
+        return self.slang_pattern.sub(lambda match: self.slang_replacements[match.group(1)], text.lower())
     
     def extract_sentences(self, text: str) -> List[str]:
         """Split text into sentences for analysis"""
         if not text:
             return []
         
-        # Simple sentence splitting on . ! ?
-        sentences = re.split(r'[.!?]+', text)
-        
-        # Clean and filter short sentences
-        cleaned_sentences = []
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if len(sentence) > 10:  # Minimum sentence length
-                cleaned_sentences.append(sentence)
-        
-        return cleaned_sentences
+        # Simple sentence splitting on . ! ?, then clean and filter short
+        # sentences (minimum sentence length) in the same pass
+        stripped = (sentence.strip() for sentence in self.sentence_boundary.split(text))
+        return [sentence for sentence in stripped if len(sentence) > 10]
     
     def remove_noise_words(self, text: str) -> str:
         """Remove common noise words that don't add sentiment value"""
-        noise_words = [
-            'lol', 'lmao', 'omg', 'wtf', 'tbh', 'imo', 'imho', 'afaik',
-            'tldr', 'tl;dr', 'fyi', 'btw', 'idk', 'ngl', 'smh'
-        ]
-        
-        for noise in noise_words:
-            text = re.sub(r'\b' + re.escape(noise) + r'\b', '', text, flags=re.IGNORECASE)
+        text = self.noise_pattern.sub('', text)
         
         return self.excessive_whitespace.sub(' ', text).strip()
     
@@ -182,24 +194,6 @@ class TextCleaner:
         if not text:
             return ""
         
-        # List of financial terms to preserve
-        financial_terms = [
-            'buy', 'sell', 'hold', 'bullish', 'bearish', 'pump', 'dump',
-            'calls', 'puts', 'options', 'strike', 'expiry', 'volume',
-            'resistance', 'support', 'breakout', 'dip', 'rally', 'correction',
-            'margin', 'leverage', 'short', 'long', 'bull', 'bear', 'market',
-            'earnings', 'revenue', 'profit', 'loss', 'eps', 'pe ratio',
-            'dividend', 'yield', 'split', 'ipo', 'spac', 'merger', 'acquisition'
-        ]
-        
-        # Store financial terms and their positions
-        preserved_terms = {}
-        text_lower = text.lower()
-        
-        for term in financial_terms:
-            if term in text_lower:
-                preserved_terms[term] = True
-        
         # Clean the text
         cleaned = self.clean_social_media(text)
         
@@ -211,6 +205,10 @@ class TextCleaner:
         if not text:
             return ""
         
+        return self._cached_clean_for_sentiment(text, normalize_slang)
+    
+    def _clean_for_sentiment(self, text: str, normalize_slang: bool) -> str:
+        """Uncached sentiment cleaning chain behind clean_for_sentiment_analysis"""
         # Clean social media content
         text = self.clean_social_media(text, preserve_tickers=True)
         
@@ -218,8 +216,9 @@ class TextCleaner:
         if normalize_slang:
             text = self.normalize_financial_slang(text)
         
-        # Remove noise words
-        text = self.remove_noise_words(text)
+        # Remove noise words; the whitespace they leave behind is normalized by
+        # the final clean_social_media pass in preserve_financial_context
+        text = self.noise_pattern.sub('', text)
         
         # Preserve financial context
         text = self.preserve_financial_context(text)
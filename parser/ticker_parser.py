@@ -1,17 +1,136 @@
+import os
 import re
-from typing import List, Dict, Set, Tuple
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Optional, Set, Tuple
 from collections import Counter
+from functools import lru_cache
 from utils.logger import setup_logger
 from utils.file_utils import load_ticker_list
 
+# Joins post texts into one scan buffer; a non-word, non-space character so
+# \b and \s+ in the ticker patterns cannot match across post boundaries
+_POST_SEPARATOR = '\x00'
+
+# Posts handed to each worker process by extract_tickers_batch; batches no
+# larger than one chunk are extracted in-process
+_BATCH_CHUNK_SIZE = 1000
+
+# Distinct texts remembered by each parser's extract_tickers_from_text
+TICKER_CACHE_SIZE = 65536
+
+# Words to exclude (common false positives)
+EXCLUDE_WORDS = frozenset({
+    'THE', 'AND', 'FOR', 'ARE', 'BUT', 'NOT', 'YOU', 'ALL', 'CAN',
+    'HER', 'WAS', 'ONE', 'OUR', 'HAD', 'BUT', 'HAVE', 'THIS', 'WILL',
+    'FROM', 'THEY', 'KNOW', 'WANT', 'BEEN', 'GOOD', 'MUCH', 'SOME',
+    'TIME', 'VERY', 'WHEN', 'COME', 'HERE', 'HOW', 'JUST', 'LIKE',
+    'LONG', 'MAKE', 'MANY', 'OVER', 'SUCH', 'TAKE', 'THAN', 'THEM',
+    'WELL', 'WERE', 'WHAT', 'YOUR', 'WAY', 'WHO', 'BOY', 'DID', 'ITS',
+    'LET', 'OLD', 'SEE', 'NOW', 'GET', 'MAN', 'NEW', 'MAY', 'SAY',
+    'USE', 'HIM', 'DAY', 'TOO', 'ANY', 'MY', 'SHE', 'PUT', 'END',
+    'WHY', 'TRY', 'GOD', 'SIX', 'DOG', 'EAT', 'AGO', 'SIT', 'FUN',
+    'BAD', 'YES', 'YET', 'ARM', 'FAR', 'OFF', 'ILL', 'OWN', 'UNDER',
+    'READ', 'LAST', 'NEVER', 'US', 'LEFT', 'FIND', 'LIFE', 'WRITE',
+    'WORK', 'PART', 'TAKE', 'PLACE', 'MADE', 'LIVE', 'WHERE', 'AFTER',
+    'BACK', 'LITTLE', 'ONLY', 'ROUND', 'YEAR', 'CAME', 'SHOW', 'EVERY',
+    'GOOD', 'ME', 'GIVE', 'OUR', 'UNDER', 'NAME', 'VERY', 'THROUGH',
+    'JUST', 'FORM', 'SENTENCE', 'GREAT', 'THINK', 'HELP', 'LOW', 'LINE',
+    'DIFFER', 'TURN', 'CAUSE', 'MUCH', 'MEAN', 'BEFORE', 'MOVE', 'RIGHT',
+    'SAME', 'TELL', 'DOES', 'SET', 'THREE', 'WANT', 'AIR', 'WELL',
+    'ALSO', 'PLAY', 'SMALL', 'END', 'HOME', 'HAND', 'LARGE', 'SPELL',
+    'ADD', 'EVEN', 'LAND', 'HERE', 'MUST', 'BIG', 'HIGH', 'SUCH', 'FOLLOW',
+    'ACT', 'WHY', 'ASK', 'MEN', 'CHANGE', 'WENT', 'LIGHT', 'KIND', 'OFF',
+    'NEED', 'HOUSE', 'PICTURE', 'TRY', 'AGAIN', 'ANIMAL', 'POINT', 'MOTHER',
+    'WORLD', 'NEAR', 'BUILD', 'SELF', 'EARTH', 'FATHER', 'HEAD', 'STAND',
+    'OWN', 'PAGE', 'SHOULD', 'COUNTRY', 'FOUND', 'ANSWER', 'SCHOOL',
+    'GROW', 'STUDY', 'STILL', 'LEARN', 'PLANT', 'COVER', 'FOOD', 'SUN',
+    'FOUR', 'BETWEEN', 'STATE', 'KEEP', 'EYE', 'NEVER', 'LAST', 'LET',
+    'THOUGHT', 'CITY', 'TREE', 'CROSS', 'FARM', 'HARD', 'START', 'MIGHT',
+    'STORY', 'SAW', 'FAR', 'SEA', 'DRAW', 'LEFT', 'LATE', 'RUN', 'WHILE',
+    'REAL', 'OPEN', 'WALK', 'SEEM', 'TOGETHER', 'NEXT', 'WHITE', 'CHILDREN',
+    'BEGINNING', 'GOT', 'LOOK', 'EXAMPLE', 'BEING', 'NOTHING', 'CALLED',
+    'IDEA', 'FISH', 'MOUNTAIN', 'NORTH', 'ONCE', 'BASE', 'HEAR', 'HORSE',
+    'CUT', 'SURE', 'WATCH', 'COLOR', 'FACE', 'WOOD', 'MAIN', 'ENOUGH',
+    'PLAIN', 'GIRL', 'USUAL', 'YOUNG', 'READY', 'ABOVE', 'EVER', 'RED',
+    'LIST', 'THOUGH', 'FEEL', 'TALK', 'BIRD', 'SOON', 'BODY', 'MUSIC',
+    'UNTIL', 'FAMILY', 'LEAVE', 'OFTEN', 'BOOK', 'THOSE', 'BOTH', 'MARK',
+    'LETTER', 'MILE', 'RIVER', 'CAR', 'FEET', 'CARE', 'SECOND', 'GROUP',
+    'CARRY', 'TOOK', 'RAIN', 'SIDE', 'REAL', 'EAT', 'ROOM', 'FRIEND',
+    'BEGAN', 'IDEA', 'FISH', 'MOUNTAIN', 'STOP', 'ONCE', 'BASE', 'HEAR',
+    'HORSE', 'CUT', 'SURE', 'WATCH', 'COLOR', 'FACE', 'WOOD', 'MAIN',
+    'OPEN', 'SEEM', 'TOGETHER', 'NEXT', 'WHITE', 'CHILDREN', 'BEGINNING',
+    'GOT', 'WALK', 'EXAMPLE', 'EASE', 'PAPER', 'OFTEN', 'ALWAYS', 'MUSIC',
+    'THOSE', 'BOTH', 'MARK', 'OFTEN', 'LETTER', 'UNTIL', 'MILE', 'RIVER',
+    'CAR', 'FEET', 'CARE', 'SECOND', 'ENOUGH', 'PLAIN', 'GIRL', 'USUAL',
+    'YOUNG', 'READY', 'ABOVE', 'EVER', 'RED', 'LIST', 'THOUGH', 'FEEL',
+    'TALK', 'BIRD', 'SOON', 'BODY', 'MUSIC', 'LEAVE', 'FAMILY', 'STARTED',
+    'REALLY', 'HIGH', 'FIELD', 'SEVERAL', 'DURING', 'POSSIBLE', 'CAME',
+    # Add the problematic words you found
+    'TERM', 'CALLS', 'PER', 'FEW', 'MORE', 'TRUMP' , 'BNB' , 'IN' , 'DYING' , 'AN' , 'DD' , 'ETH' , 'BTC' , 'AT' , 'DOT' , 'NICE' , 'AS' , 'MOONS' , 'VISAS' , 'RTA' , 'RATES' , 'POST' , 'LINK' , 'BUY' , 'BY' , 'LESS' , 'TECH' , 'LYC' , 'BEACH' , 'RANGE' , 'TO' , 'STUFF' , 'COVID' , 'OF' , 'USING' , 'AHEAD' , 'VALID'
+})
+
+# Common false positives rejected by is_valid_ticker on top of EXCLUDE_WORDS
+COMMON_FALSE_POSITIVES = frozenset({
+    'TERM', 'CALLS', 'PER', 'FEW', 'MORE', 'TRUMP', 'CHEAP', 'TAILS', 'THAT', 'HAUL', 'WITH', 'INTO',
+    'THE', 'AND', 'FOR', 'ARE', 'BUT', 'NOT', 'YOU', 'ALL', 'CAN',
+    'HER', 'WAS', 'ONE', 'OUR', 'HAD', 'HAVE', 'THIS', 'WILL',
+    'FROM', 'THEY', 'KNOW', 'WANT', 'BEEN', 'GOOD', 'MUCH', 'SOME',
+    'TIME', 'VERY', 'WHEN', 'COME', 'HERE', 'HOW', 'JUST', 'LIKE',
+    'LONG', 'MAKE', 'MANY', 'OVER', 'SUCH', 'TAKE', 'THAN', 'THEM',
+    'WELL', 'WERE', 'WHAT', 'YOUR', 'WAY', 'WHO', 'BOY', 'DID', 'ITS',
+    'LET', 'OLD', 'SEE', 'NOW', 'GET', 'MAN', 'NEW', 'MAY', 'SAY',
+    'USE', 'HIM', 'DAY', 'TOO', 'ANY', 'MY', 'SHE', 'PUT', 'END',
+    'WHY', 'TRY', 'GOD', 'SIX', 'DOG', 'EAT', 'AGO', 'SIT', 'FUN',
+    'BAD', 'YES', 'YET', 'ARM', 'FAR', 'OFF', 'ILL', 'OWN', 'UNDER',
+    'READ', 'LAST', 'NEVER', 'US', 'LEFT', 'FIND', 'LIFE', 'WRITE',
+    'WORK', 'PART', 'TAKE', 'PLACE', 'MADE', 'LIVE', 'WHERE', 'AFTER',
+    'BACK', 'LITTLE', 'ONLY', 'ROUND', 'YEAR', 'CAME', 'SHOW', 'EVERY',
+    'GOOD', 'ME', 'GIVE', 'OUR', 'UNDER', 'NAME', 'VERY', 'THROUGH',
+    'JUST', 'FORM', 'SENTENCE', 'GREAT', 'THINK', 'HELP', 'LOW', 'LINE',
+    'DIFFER', 'TURN', 'CAUSE', 'MUCH', 'MEAN', 'BEFORE', 'MOVE', 'RIGHT',
+    'SAME', 'TELL', 'DOES', 'SET', 'THREE', 'WANT', 'AIR', 'WELL',
+    'ALSO', 'PLAY', 'SMALL', 'END', 'HOME', 'HAND', 'LARGE', 'SPELL',
+    'ADD', 'EVEN', 'LAND', 'HERE', 'MUST', 'BIG', 'HIGH', 'SUCH', 'FOLLOW',
+    'ACT', 'WHY', 'ASK', 'MEN', 'CHANGE', 'WENT', 'LIGHT', 'KIND', 'OFF',
+    'NEED', 'HOUSE', 'PICTURE', 'TRY', 'AGAIN', 'ANIMAL', 'POINT', 'MOTHER',
+    'WORLD', 'NEAR', 'BUILD', 'SELF', 'EARTH', 'FATHER', 'HEAD', 'STAND',
+    'OWN', 'PAGE', 'SHOULD', 'COUNTRY', 'FOUND', 'ANSWER', 'SCHOOL',
+    'GROW', 'STUDY', 'STILL', 'LEARN', 'PLANT', 'COVER', 'FOOD', 'SUN',
+    'FOUR', 'BETWEEN', 'STATE', 'KEEP', 'EYE', 'NEVER', 'LAST', 'LET',
+    'THOUGHT', 'CITY', 'TREE', 'CROSS', 'FARM', 'HARD', 'START', 'MIGHT',
+    'STORY', 'SAW', 'FAR', 'SEA', 'DRAW', 'LEFT', 'LATE', 'RUN', 'WHILE',
+    'REAL', 'OPEN', 'WALK', 'SEEM', 'TOGETHER', 'NEXT', 'WHITE', 'CHILDREN',
+    'BEGINNING', 'GOT', 'LOOK', 'EXAMPLE', 'BEING', 'NOTHING', 'CALLED',
+    'IDEA', 'FISH', 'MOUNTAIN', 'NORTH', 'ONCE', 'BASE', 'HEAR', 'HORSE',
+    'CUT', 'SURE', 'WATCH', 'COLOR', 'FACE', 'WOOD', 'MAIN', 'ENOUGH',
+    'PLAIN', 'GIRL', 'USUAL', 'YOUNG', 'READY', 'ABOVE', 'EVER', 'RED',
+    'LIST', 'THOUGH', 'FEEL', 'TALK', 'BIRD', 'SOON', 'BODY', 'MUSIC',
+    'UNTIL', 'FAMILY', 'LEAVE', 'OFTEN', 'BOOK', 'THOSE', 'BOTH', 'MARK',
+    'LETTER', 'MILE', 'RIVER', 'CAR', 'FEET', 'CARE', 'SECOND', 'GROUP',
+    'CARRY', 'TOOK', 'RAIN', 'SIDE', 'REAL', 'EAT', 'ROOM', 'FRIEND',
+    'BEGAN', 'IDEA', 'FISH', 'MOUNTAIN', 'STOP', 'ONCE', 'BASE', 'HEAR',
+    'HORSE', 'CUT', 'SURE', 'WATCH', 'COLOR', 'FACE', 'WOOD', 'MAIN',
+    'OPEN', 'SEEM', 'TOGETHER', 'NEXT', 'WHITE', 'CHILDREN', 'BEGINNING',
+    'GOT', 'WALK', 'EXAMPLE', 'EASE', 'PAPER', 'OFTEN', 'ALWAYS', 'MUSIC',
+    'THOSE', 'BOTH', 'MARK', 'OFTEN', 'LETTER', 'UNTIL', 'MILE', 'RIVER',
+    'CAR', 'FEET', 'CARE', 'SECOND', 'ENOUGH', 'PLAIN', 'GIRL', 'USUAL',
+    'YOUNG', 'READY', 'ABOVE', 'EVER', 'RED', 'LIST', 'THOUGH', 'FEEL',
+    'TALK', 'BIRD', 'SOON', 'BODY', 'MUSIC', 'LEAVE', 'FAMILY', 'STARTED',
+    'REALLY', 'HIGH', 'FIELD', 'SEVERAL', 'DURING', 'POSSIBLE', 'CAME',
+})
+# Every rejected word in one set, built once at import for is_valid_ticker
+_EXCLUDED_TICKERS = EXCLUDE_WORDS | COMMON_FALSE_POSITIVES
+
 class TickerParser:
     """Extracts and validates ticker symbols from text"""
     
-    def __init__(self):
+    def __init__(self, ticker_file: str = 'tickers.csv'):
         self.logger = setup_logger('TickerParser')
         
         # Load known ticker symbols
-        self.known_tickers = set(load_ticker_list())
+        self.ticker_file = ticker_file
+        self.known_tickers = set(load_ticker_list(ticker_file))
         
         # Regex patterns for ticker extraction
         self.ticker_patterns = [
@@ -26,76 +145,48 @@ class TickerParser:
             r'\b(BTC|ETH|ADA|DOT|LINK|LTC|XRP|BCH|BNB|SOL|DOGE|SHIB)\b',  # Common crypto
         ]
         
-        # Words to exclude (common false positives)
-        self.exclude_words = {
-            'THE', 'AND', 'FOR', 'ARE', 'BUT', 'NOT', 'YOU', 'ALL', 'CAN',
-            'HER', 'WAS', 'ONE', 'OUR', 'HAD', 'BUT', 'HAVE', 'THIS', 'WILL',
-            'FROM', 'THEY', 'KNOW', 'WANT', 'BEEN', 'GOOD', 'MUCH', 'SOME',
-            'TIME', 'VERY', 'WHEN', 'COME', 'HERE', 'HOW', 'JUST', 'LIKE',
-            'LONG', 'MAKE', 'MANY', 'OVER', 'SUCH', 'TAKE', 'THAN', 'THEM',
-            'WELL', 'WERE', 'WHAT', 'YOUR', 'WAY', 'WHO', 'BOY', 'DID', 'ITS',
-            'LET', 'OLD', 'SEE', 'NOW', 'GET', 'MAN', 'NEW', 'MAY', 'SAY',
-            'USE', 'HIM', 'DAY', 'TOO', 'ANY', 'MY', 'SHE', 'PUT', 'END',
-            'WHY', 'TRY', 'GOD', 'SIX', 'DOG', 'EAT', 'AGO', 'SIT', 'FUN',
-            'BAD', 'YES', 'YET', 'ARM', 'FAR', 'OFF', 'ILL', 'OWN', 'UNDER',
-            'READ', 'LAST', 'NEVER', 'US', 'LEFT', 'FIND', 'LIFE', 'WRITE',
-            'WORK', 'PART', 'TAKE', 'PLACE', 'MADE', 'LIVE', 'WHERE', 'AFTER',
-            'BACK', 'LITTLE', 'ONLY', 'ROUND', 'YEAR', 'CAME', 'SHOW', 'EVERY',
-            'GOOD', 'ME', 'GIVE', 'OUR', 'UNDER', 'NAME', 'VERY', 'THROUGH',
-            'JUST', 'FORM', 'SENTENCE', 'GREAT', 'THINK', 'HELP', 'LOW', 'LINE',
-            'DIFFER', 'TURN', 'CAUSE', 'MUCH', 'MEAN', 'BEFORE', 'MOVE', 'RIGHT',
-            'SAME', 'TELL', 'DOES', 'SET', 'THREE', 'WANT', 'AIR', 'WELL',
-            'ALSO', 'PLAY', 'SMALL', 'END', 'HOME', 'HAND', 'LARGE', 'SPELL',
-            'ADD', 'EVEN', 'LAND', 'HERE', 'MUST', 'BIG', 'HIGH', 'SUCH', 'FOLLOW',
-            'ACT', 'WHY', 'ASK', 'MEN', 'CHANGE', 'WENT', 'LIGHT', 'KIND', 'OFF',
-            'NEED', 'HOUSE', 'PICTURE', 'TRY', 'AGAIN', 'ANIMAL', 'POINT', 'MOTHER',
-            'WORLD', 'NEAR', 'BUILD', 'SELF', 'EARTH', 'FATHER', 'HEAD', 'STAND',
-            'OWN', 'PAGE', 'SHOULD', 'COUNTRY', 'FOUND', 'ANSWER', 'SCHOOL',
-            'GROW', 'STUDY', 'STILL', 'LEARN', 'PLANT', 'COVER', 'FOOD', 'SUN',
-            'FOUR', 'BETWEEN', 'STATE', 'KEEP', 'EYE', 'NEVER', 'LAST', 'LET',
-            'THOUGHT', 'CITY', 'TREE', 'CROSS', 'FARM', 'HARD', 'START', 'MIGHT',
-            'STORY', 'SAW', 'FAR', 'SEA', 'DRAW', 'LEFT', 'LATE', 'RUN', 'WHILE',
-            'REAL', 'OPEN', 'WALK', 'SEEM', 'TOGETHER', 'NEXT', 'WHITE', 'CHILDREN',
-            'BEGINNING', 'GOT', 'LOOK', 'EXAMPLE', 'BEING', 'NOTHING', 'CALLED',
-            'IDEA', 'FISH', 'MOUNTAIN', 'NORTH', 'ONCE', 'BASE', 'HEAR', 'HORSE',
-            'CUT', 'SURE', 'WATCH', 'COLOR', 'FACE', 'WOOD', 'MAIN', 'ENOUGH',
-            'PLAIN', 'GIRL', 'USUAL', 'YOUNG', 'READY', 'ABOVE', 'EVER', 'RED',
-            'LIST', 'THOUGH', 'FEEL', 'TALK', 'BIRD', 'SOON', 'BODY', 'MUSIC',
-            'UNTIL', 'FAMILY', 'LEAVE', 'OFTEN', 'BOOK', 'THOSE', 'BOTH', 'MARK',
-            'LETTER', 'MILE', 'RIVER', 'CAR', 'FEET', 'CARE', 'SECOND', 'GROUP',
-            'CARRY', 'TOOK', 'RAIN', 'SIDE', 'REAL', 'EAT', 'ROOM', 'FRIEND',
-            'BEGAN', 'IDEA', 'FISH', 'MOUNTAIN', 'STOP', 'ONCE', 'BASE', 'HEAR',
-            'HORSE', 'CUT', 'SURE', 'WATCH', 'COLOR', 'FACE', 'WOOD', 'MAIN',
-            'OPEN', 'SEEM', 'TOGETHER', 'NEXT', 'WHITE', 'CHILDREN', 'BEGINNING',
-            'GOT', 'WALK', 'EXAMPLE', 'EASE', 'PAPER', 'OFTEN', 'ALWAYS', 'MUSIC',
-            'THOSE', 'BOTH', 'MARK', 'OFTEN', 'LETTER', 'UNTIL', 'MILE', 'RIVER',
-            'CAR', 'FEET', 'CARE', 'SECOND', 'ENOUGH', 'PLAIN', 'GIRL', 'USUAL',
-            'YOUNG', 'READY', 'ABOVE', 'EVER', 'RED', 'LIST', 'THOUGH', 'FEEL',
-            'TALK', 'BIRD', 'SOON', 'BODY', 'MUSIC', 'LEAVE', 'FAMILY', 'STARTED',
-            'REALLY', 'HIGH', 'FIELD', 'SEVERAL', 'DURING', 'POSSIBLE', 'CAME',
-            # Add the problematic words you found
-            'TERM', 'CALLS', 'PER', 'FEW', 'MORE', 'TRUMP' , 'BNB' , 'IN' , 'DYING' , 'AN' , 'DD' , 'ETH' , 'BTC' , 'AT' , 'DOT' , 'NICE' , 'AS' , 'MOONS' , 'VISAS' , 'RTA' , 'RATES' , 'POST' , 'LINK' , 'BUY' , 'BY' , 'LESS' , 'TECH' , 'LYC' , 'BEACH' , 'RANGE' , 'TO' , 'STUFF' , 'COVID' , 'OF' , 'USING' , 'AHEAD' , 'VALID'         }
+        # Literal text at least one of the patterns above needs; an uppercased text
+        # containing none of these cannot match, so the regex scan is skipped
+        self.ticker_markers = [
+            '$', 'STOCK', 'SHARE', 'TICKER', 'BUY', 'SELL', 'LONG', 'SHORT',
+            'USD', 'BTC', 'ETH', 'ADA', 'DOT', 'LINK', 'LTC', 'XRP', 'BCH', 'BNB',
+            'SOL', 'DOGE', 'SHIB'
+        ]
+        
+        # Ticker and crypto patterns compiled once; every pattern has exactly one capture
+        # group. They are scanned one by one rather than as a single alternation: their
+        # matches can overlap ("SHORT STOCK" is both a "buy/sell/long/short X" and an
+        # "X stock" mention), and an alternation would only report the first of them
+        self._ticker_res = [re.compile(pattern, re.IGNORECASE)
+                            for pattern in self.ticker_patterns + self.crypto_patterns]
+        self._ticker_marker_re = re.compile('|'.join(re.escape(marker) for marker in self.ticker_markers))
         
         # Common stock exchange suffixes to remove
         self.exchange_suffixes = {'.TO', '.V', '.L', '.PA', '.DE', '.HK'}
+        
+        # Extraction depends only on the text, so repeated texts (retweets, crossposts,
+        # bot reposts) are scanned once
+        self._cached_tickers_from_text = lru_cache(maxsize=TICKER_CACHE_SIZE)(self._tickers_from_text)
     
     def extract_tickers_from_text(self, text: str) -> List[str]:
         """Extract potential ticker symbols from text"""
         if not text:
             return []
         
+        # The cached result is shared, so callers get their own list
+        return list(self._cached_tickers_from_text(text))
+    
+    def _tickers_from_text(self, text: str) -> Tuple[str, ...]:
+        """Uncached extraction behind extract_tickers_from_text"""
         text = text.upper()
-        extracted_tickers = set()
         
-        # Apply all ticker patterns
-        for pattern in self.ticker_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            extracted_tickers.update(matches)
+        # Most posts mention no ticker at all; skip the full scan for them
+        if not self._ticker_marker_re.search(text):
+            return ()
         
-        # Apply crypto patterns
-        for pattern in self.crypto_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            extracted_tickers.update(matches)
+        # Apply all ticker and crypto patterns
+        extracted_tickers = {match.group(1) for ticker_re in self._ticker_res
+                             for match in ticker_re.finditer(text)}
         
         # Clean and validate tickers
         valid_tickers = []
@@ -104,7 +195,7 @@ class TickerParser:
             if self.is_valid_ticker(cleaned_ticker):
                 valid_tickers.append(cleaned_ticker)
         
-        return list(set(valid_tickers))  # Remove duplicates
+        return tuple(set(valid_tickers))  # Remove duplicates
     
     def clean_ticker(self, ticker: str) -> str:
         """Clean and normalize ticker symbol"""
@@ -136,61 +227,8 @@ class TickerParser:
         if not ticker.isalpha():
             return False
         
-        # Exclude common words
-        if ticker in self.exclude_words:
-            return False
-        
-        # Additional validation for common false positives
-        common_false_positives = {
-            'TERM', 'CALLS', 'PER', 'FEW', 'MORE', 'TRUMP', 'CHEAP', 'TAILS', 'THAT', 'HAUL', 'WITH', 'INTO',
-            'THE', 'AND', 'FOR', 'ARE', 'BUT', 'NOT', 'YOU', 'ALL', 'CAN',
-            'HER', 'WAS', 'ONE', 'OUR', 'HAD', 'HAVE', 'THIS', 'WILL',
-            'FROM', 'THEY', 'KNOW', 'WANT', 'BEEN', 'GOOD', 'MUCH', 'SOME',
-            'TIME', 'VERY', 'WHEN', 'COME', 'HERE', 'HOW', 'JUST', 'LIKE',
-            'LONG', 'MAKE', 'MANY', 'OVER', 'SUCH', 'TAKE', 'THAN', 'THEM',
-            'WELL', 'WERE', 'WHAT', 'YOUR', 'WAY', 'WHO', 'BOY', 'DID', 'ITS',
-            'LET', 'OLD', 'SEE', 'NOW', 'GET', 'MAN', 'NEW', 'MAY', 'SAY',
-            'USE', 'HIM', 'DAY', 'TOO', 'ANY', 'MY', 'SHE', 'PUT', 'END',
-            'WHY', 'TRY', 'GOD', 'SIX', 'DOG', 'EAT', 'AGO', 'SIT', 'FUN',
-            'BAD', 'YES', 'YET', 'ARM', 'FAR', 'OFF', 'ILL', 'OWN', 'UNDER',
-            'READ', 'LAST', 'NEVER', 'US', 'LEFT', 'FIND', 'LIFE', 'WRITE',
-            'WORK', 'PART', 'TAKE', 'PLACE', 'MADE', 'LIVE', 'WHERE', 'AFTER',
-            'BACK', 'LITTLE', 'ONLY', 'ROUND', 'YEAR', 'CAME', 'SHOW', 'EVERY',
-            'GOOD', 'ME', 'GIVE', 'OUR', 'UNDER', 'NAME', 'VERY', 'THROUGH',
-            'JUST', 'FORM', 'SENTENCE', 'GREAT', 'THINK', 'HELP', 'LOW', 'LINE',
-            'DIFFER', 'TURN', 'CAUSE', 'MUCH', 'MEAN', 'BEFORE', 'MOVE', 'RIGHT',
-            'SAME', 'TELL', 'DOES', 'SET', 'THREE', 'WANT', 'AIR', 'WELL',
-            'ALSO', 'PLAY', 'SMALL', 'END', 'HOME', 'HAND', 'LARGE', 'SPELL',
-            'ADD', 'EVEN', 'LAND', 'HERE', 'MUST', 'BIG', 'HIGH', 'SUCH', 'FOLLOW',
-            'ACT', 'WHY', 'ASK', 'MEN', 'CHANGE', 'WENT', 'LIGHT', 'KIND', 'OFF',
-            'NEED', 'HOUSE', 'PICTURE', 'TRY', 'AGAIN', 'ANIMAL', 'POINT', 'MOTHER',
-            'WORLD', 'NEAR', 'BUILD', 'SELF', 'EARTH', 'FATHER', 'HEAD', 'STAND',
-            'OWN', 'PAGE', 'SHOULD', 'COUNTRY', 'FOUND', 'ANSWER', 'SCHOOL',
-            'GROW', 'STUDY', 'STILL', 'LEARN', 'PLANT', 'COVER', 'FOOD', 'SUN',
-            'FOUR', 'BETWEEN', 'STATE', 'KEEP', 'EYE', 'NEVER', 'LAST', 'LET',
-            'THOUGHT', 'CITY', 'TREE', 'CROSS', 'FARM', 'HARD', 'START', 'MIGHT',
-            'STORY', 'SAW', 'FAR', 'SEA', 'DRAW', 'LEFT', 'LATE', 'RUN', 'WHILE',
-            'REAL', 'OPEN', 'WALK', 'SEEM', 'TOGETHER', 'NEXT', 'WHITE', 'CHILDREN',
-            'BEGINNING', 'GOT', 'LOOK', 'EXAMPLE', 'BEING', 'NOTHING', 'CALLED',
-            'IDEA', 'FISH', 'MOUNTAIN', 'NORTH', 'ONCE', 'BASE', 'HEAR', 'HORSE',
-            'CUT', 'SURE', 'WATCH', 'COLOR', 'FACE', 'WOOD', 'MAIN', 'ENOUGH',
-            'PLAIN', 'GIRL', 'USUAL', 'YOUNG', 'READY', 'ABOVE', 'EVER', 'RED',
-            'LIST', 'THOUGH', 'FEEL', 'TALK', 'BIRD', 'SOON', 'BODY', 'MUSIC',
-            'UNTIL', 'FAMILY', 'LEAVE', 'OFTEN', 'BOOK', 'THOSE', 'BOTH', 'MARK',
-            'LETTER', 'MILE', 'RIVER', 'CAR', 'FEET', 'CARE', 'SECOND', 'GROUP',
-            'CARRY', 'TOOK', 'RAIN', 'SIDE', 'REAL', 'EAT', 'ROOM', 'FRIEND',
-            'BEGAN', 'IDEA', 'FISH', 'MOUNTAIN', 'STOP', 'ONCE', 'BASE', 'HEAR',
-            'HORSE', 'CUT', 'SURE', 'WATCH', 'COLOR', 'FACE', 'WOOD', 'MAIN',
-            'OPEN', 'SEEM', 'TOGETHER', 'NEXT', 'WHITE', 'CHILDREN', 'BEGINNING',
-            'GOT', 'WALK', 'EXAMPLE', 'EASE', 'PAPER', 'OFTEN', 'ALWAYS', 'MUSIC',
-            'THOSE', 'BOTH', 'MARK', 'OFTEN', 'LETTER', 'UNTIL', 'MILE', 'RIVER',
-            'CAR', 'FEET', 'CARE', 'SECOND', 'ENOUGH', 'PLAIN', 'GIRL', 'USUAL',
-            'YOUNG', 'READY', 'ABOVE', 'EVER', 'RED', 'LIST', 'THOUGH', 'FEEL',
-            'TALK', 'BIRD', 'SOON', 'BODY', 'MUSIC', 'LEAVE', 'FAMILY', 'STARTED',
-            'REALLY', 'HIGH', 'FIELD', 'SEVERAL', 'DURING', 'POSSIBLE', 'CAME',
-        }
-        
-        if ticker in common_false_positives:
+        # Exclude common words and common false positives
+        if ticker in _EXCLUDED_TICKERS:
             return False
         
         # Check against known tickers list (optional validation)
@@ -200,22 +238,91 @@ class TickerParser:
         
         return True
     
+    def extract_tickers_from_texts(self, texts: List[str]) -> List[List[str]]:
+        """Extract tickers from many texts at once (same results as per-text extraction)"""
+        upper_texts = [text.upper() if text else '' for text in texts]
+        
+        # Duplicate texts (retweets, crossposts, bot reposts) are scanned once;
+        # text_slots maps each input text to its distinct uppercased text
+        distinct_texts = {}
+        text_slots = [distinct_texts.setdefault(text, len(distinct_texts)) for text in upper_texts]
+        upper_texts = list(distinct_texts)
+        candidates = [set() for _ in upper_texts]
+        
+        # Only texts containing a pattern marker can match; the rest keep no candidates
+        scan_indices = [index for index, text in enumerate(upper_texts)
+                        if self._ticker_marker_re.search(text)]
+        
+        # Join the remaining texts into one buffer so each pattern is a single C-level scan
+        text_starts = []
+        offset = 0
+        for index in scan_indices:
+            text_starts.append(offset)
+            offset += len(upper_texts[index]) + len(_POST_SEPARATOR)
+        buffer = _POST_SEPARATOR.join(upper_texts[index] for index in scan_indices)
+        
+        # Map each match back to the text it came from
+        for ticker_re in self._ticker_res:
+            for match in ticker_re.finditer(buffer):
+                text_index = scan_indices[bisect_right(text_starts, match.start()) - 1]
+                candidates[text_index].add(match.group(1))
+        
+        # Clean and validate each distinct raw candidate once for the whole batch;
+        # resolved maps it to its cleaned ticker, or None when that is invalid
+        resolved = {}
+        for candidate in set().union(*candidates):
+            cleaned_ticker = self.clean_ticker(candidate)
+            resolved[candidate] = cleaned_ticker if self.is_valid_ticker(cleaned_ticker) else None
+        
+        results = []
+        for text_candidates in candidates:
+            valid_tickers = {resolved[candidate] for candidate in text_candidates}
+            valid_tickers.discard(None)
+            results.append(valid_tickers)
+        
+        return [list(results[slot]) for slot in text_slots]
+    
     def extract_tickers_from_posts(self, posts: List[Dict]) -> Dict[str, List[Dict]]:
         """Extract tickers from multiple posts and group by ticker"""
+        post_tickers = self.extract_tickers_from_texts([post.get('text', '') for post in posts])
+        return self._group_posts_by_ticker(posts, post_tickers)
+    
+    def extract_tickers_batch(self, posts: List[Dict], workers: Optional[int] = 1) -> Dict[str, List[Dict]]:
+        """Extract tickers from a batch of posts and group by ticker, optionally across worker processes
+        
+        Worker processes are opt-in: workers > 1 (or None for every CPU) starts a new process
+        pool for each call on batches larger than one chunk. On Linux the pool forks the
+        calling process, which is unsafe while other threads are running (fetcher thread
+        pools, the threaded web server), and every worker re-reads the ticker list.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        texts = [post.get('text', '') for post in posts]
+        
+        if workers <= 1 or len(texts) <= _BATCH_CHUNK_SIZE:
+            post_tickers = self.extract_tickers_from_texts(texts)
+        else:
+            # Only the texts are sent to the workers; each builds its own parser once
+            chunks = [texts[i:i + _BATCH_CHUNK_SIZE] for i in range(0, len(texts), _BATCH_CHUNK_SIZE)]
+            with ProcessPoolExecutor(max_workers=min(workers, len(chunks)),
+                                     initializer=_init_worker_parser,
+                                     initargs=(self.ticker_file,)) as executor:
+                post_tickers = [tickers for chunk_tickers in executor.map(_extract_tickers_chunk, chunks)
+                                for tickers in chunk_tickers]
+        
+        return self._group_posts_by_ticker(posts, post_tickers)
+    
+    def _group_posts_by_ticker(self, posts: List[Dict], post_tickers: List[List[str]]) -> Dict[str, List[Dict]]:
+        """Group posts under each ticker they mention"""
         ticker_posts = {}
         
-        for post in posts:
-            text = post.get('text', '')
-            tickers = self.extract_tickers_from_text(text)
-            
+        # The original post dicts are shared between tickers, not copied per mention;
+        # the grouping key already records which ticker each list is for
+        for post, tickers in zip(posts, post_tickers):
             for ticker in tickers:
                 if ticker not in ticker_posts:
                     ticker_posts[ticker] = []
-                
-                # Add post with ticker mention
-                post_with_ticker = post.copy()
-                post_with_ticker['mentioned_ticker'] = ticker
-                ticker_posts[ticker].append(post_with_ticker)
+                ticker_posts[ticker].append(post)
         
         return ticker_posts
     
@@ -223,9 +330,7 @@ class TickerParser:
         """Count ticker mentions across all posts"""
         all_tickers = []
         
-        for post in posts:
-            text = post.get('text', '')
-            tickers = self.extract_tickers_from_text(text)
+        for tickers in self.extract_tickers_from_texts([post.get('text', '') for post in posts]):
             all_tickers.extend(tickers)
         
         return Counter(all_tickers)
@@ -237,18 +342,36 @@ class TickerParser:
     
     def get_ticker_context(self, posts: List[Dict], ticker: str, context_window: int = 50) -> List[str]:
         """Extract context around ticker mentions for sentiment analysis"""
-        contexts = []
+        return self.get_tickers_context(posts, [ticker], context_window)[ticker]
+    
+    def get_tickers_context(self, posts: List[Dict], tickers: List[str], context_window: int = 50) -> Dict[str, List[str]]:
+        """Extract context around mentions of several tickers in one pass over the posts"""
+        contexts = {ticker: [] for ticker in tickers}
         
         for post in posts:
             text = post.get('text', '')
-            if ticker in text.upper():
+            # Uppercase each post once and reuse it for every ticker
+            text_upper = text.upper()
+            
+            for ticker in contexts:
                 # Find ticker position and extract context
-                text_upper = text.upper()
                 ticker_pos = text_upper.find(ticker)
                 if ticker_pos != -1:
                     start = max(0, ticker_pos - context_window)
                     end = min(len(text), ticker_pos + len(ticker) + context_window)
                     context = text[start:end].strip()
-                    contexts.append(context)
+                    contexts[ticker].append(context)
         
-        return contexts 
\ No newline at end of file
+        return contexts
+
+# Parser owned by each extract_tickers_batch worker process
+_worker_parser = None
+
+def _init_worker_parser(ticker_file: str) -> None:
+    """Build the worker's TickerParser once, when the worker process starts"""
+    global _worker_parser
+    _worker_parser = TickerParser(ticker_file)
+
+def _extract_tickers_chunk(texts: List[str]) -> List[List[str]]:
+    """Extract tickers from one chunk of post texts inside a worker process"""
+    return _worker_parser.extract_tickers_from_texts(texts)
@@ -1,7 +1,10 @@
 from typing import Dict, List, Any, Tuple
 from datetime import datetime
-import math
+from collections import Counter
+import heapq
+import numpy as np
 from utils.logger import setup_logger
+from utils.time_utils import parse_timestamp
 from .volume_scorer import VolumeScorer
 from .sentiment_scorer import SentimentScorer
 from parser.ticker_parser import TickerParser
@@ -16,13 +19,14 @@ class HypeScorer:
         # Initialize component scorers
         self.volume_scorer = VolumeScorer(config.get('volume_scorer', {}))
         self.sentiment_scorer = SentimentScorer(config.get('sentiment_scorer', {}))
-        self.ticker_parser = TickerParser()
+        self.ticker_parser = TickerParser(config.get('ticker_file', 'tickers.csv'))
         
         # Scoring weights from configuration
         self.volume_weight = config.get('volume_weight', 0.7)
         self.sentiment_weight = config.get('sentiment_weight', 0.3)
         self.min_mentions = config.get('min_mentions', 5)
         self.top_n_tickers = config.get('top_n_tickers', 20)
+        self.parser_workers = config.get('parser_workers', 1)  # Ticker extraction processes; None uses every CPU
         
         # Additional scoring parameters
         self.recency_boost = config.get('recency_boost', True)
@@ -44,7 +48,7 @@ class HypeScorer:
         self.logger.info(f"Calculating hype scores for {len(posts)} posts")
         
         # Extract tickers from posts
-        ticker_posts = self.ticker_parser.extract_tickers_from_posts(posts)
+        ticker_posts = self.ticker_parser.extract_tickers_batch(posts, workers=self.parser_workers)
         
         if not ticker_posts:
             self.logger.warning("No tickers found in posts")
@@ -58,7 +62,7 @@ class HypeScorer:
             if len(ticker_post_list) >= self.min_mentions:
                 filtered_ticker_posts[ticker] = ticker_post_list
             else:
-                self.logger.debug(f"Filtered out {ticker} (only {len(ticker_post_list)} mentions)")
+                self.logger.debug("Filtered out %s (only %d mentions)", ticker, len(ticker_post_list))
         
         if not filtered_ticker_posts:
             self.logger.warning(f"No tickers with >= {self.min_mentions} mentions")
@@ -66,29 +70,48 @@ class HypeScorer:
         
         self.logger.info(f"After filtering: {len(filtered_ticker_posts)} tickers remain")
         
-        # Calculate volume scores
-        volume_scores = self.volume_scorer.calculate_comprehensive_volume_score(filtered_ticker_posts)
-        volume_metrics = self.volume_scorer.get_volume_metrics(filtered_ticker_posts)
+        # Calculate volume scores; both views share one pass over the posts
+        volume_components = self.volume_scorer.calculate_all_components(filtered_ticker_posts)
+        volume_scores = self.volume_scorer.calculate_comprehensive_volume_score(filtered_ticker_posts, volume_components)
+        volume_metrics = self.volume_scorer.get_volume_metrics(filtered_ticker_posts, volume_components)
         
         # Calculate sentiment scores
-        sentiment_scores = self.sentiment_scorer.calculate_comprehensive_sentiment_score(filtered_ticker_posts)
+        sentiment_scores = self.sentiment_scorer.calculate_comprehensive_sentiment_score(
+            filtered_ticker_posts, min_confidence=self.min_sentiment_confidence
+        )
+        
+        # Keep tickers with enough sentiment confidence
+        scored_tickers = []
+        for ticker in filtered_ticker_posts.keys():
+            sentiment_confidence = sentiment_scores.get(ticker, {}).get('confidence', 0.0)
+            
+            # Skip tickers with very low sentiment confidence if configured
+            if sentiment_confidence < self.min_sentiment_confidence:
+                self.logger.debug("Skipping %s due to low sentiment confidence: %s", ticker, sentiment_confidence)
+                continue
+            
+            scored_tickers.append(ticker)
+        
+        # Calculate base hype scores for all tickers in one vectorized pass
+        volume_array = np.array([volume_scores.get(ticker, 0.0) for ticker in scored_tickers], dtype=np.float64)
+        sentiment_array = np.array([sentiment_scores.get(ticker, {}).get('sentiment_score', 0.0)
+                                    for ticker in scored_tickers], dtype=np.float64)
+        base_scores = (volume_array * self.volume_weight) + (sentiment_array * self.sentiment_weight)
         
         # Combine scores
         hype_results = []
         
-        for ticker in filtered_ticker_posts.keys():
+        # One clock read shared by every ticker's recency multiplier and result timestamp
+        current_time = datetime.now()
+        current_time_iso = current_time.isoformat()
+        
+        for ticker, hype_score in zip(scored_tickers, base_scores.tolist()):
             volume_score = volume_scores.get(ticker, 0.0)
             sentiment_data = sentiment_scores.get(ticker, {})
             sentiment_score = sentiment_data.get('sentiment_score', 0.0)
             sentiment_confidence = sentiment_data.get('confidence', 0.0)
             
-            # Skip tickers with very low sentiment confidence if configured
-            if sentiment_confidence < self.min_sentiment_confidence:
-                self.logger.debug(f"Skipping {ticker} due to low sentiment confidence: {sentiment_confidence}")
-                continue
-            
-            # Calculate base hype score
-            hype_score = (volume_score * self.volume_weight) + (sentiment_score * self.sentiment_weight)
+            platforms = list(set(post.get('source', '') for post in filtered_ticker_posts[ticker]))
             
             # Apply additional scoring factors
             hype_score = self._apply_scoring_modifiers(
@@ -96,7 +119,9 @@ class HypeScorer:
                 hype_score, 
                 filtered_ticker_posts[ticker],
                 volume_metrics.get(ticker, {}),
-                sentiment_data
+                sentiment_data,
+                platform_count=len(platforms),
+                current_time=current_time
             )
             
             # Compile comprehensive result
@@ -107,7 +132,7 @@ class HypeScorer:
                 'sentiment_score': sentiment_score,
                 'sentiment_confidence': sentiment_confidence,
                 'mention_count': len(filtered_ticker_posts[ticker]),
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': current_time_iso,
                 
                 # Volume metrics
                 'volume_metrics': volume_metrics.get(ticker, {}),
@@ -119,8 +144,8 @@ class HypeScorer:
                 'textblob_sentiment': sentiment_data.get('textblob_sentiment', 0.0),
                 
                 # Platform distribution
-                'platforms': list(set(post.get('source', '') for post in filtered_ticker_posts[ticker])),
-                'platform_count': len(set(post.get('source', '') for post in filtered_ticker_posts[ticker])),
+                'platforms': platforms,
+                'platform_count': len(platforms),
                 
                 # Sample posts for context
                 'sample_posts': self._get_sample_posts(filtered_ticker_posts[ticker], 3)
@@ -128,40 +153,41 @@ class HypeScorer:
             
             hype_results.append(result)
         
-        # Sort by hype score descending
-        hype_results.sort(key=lambda x: x['hype_score'], reverse=True)
+        # Keep the top N by hype score, highest first
+        top_results = heapq.nlargest(self.top_n_tickers, hype_results, key=lambda x: x['hype_score'])
         
         # Normalize ranks
-        for i, result in enumerate(hype_results):
+        for i, result in enumerate(top_results):
             result['rank'] = i + 1
         
-        # Return top N results
-        top_results = hype_results[:self.top_n_tickers]
-        
         self.logger.info(f"Generated hype scores for {len(top_results)} top tickers")
         
         return top_results
     
     def _apply_scoring_modifiers(self, ticker: str, base_score: float, posts: List[Dict], 
-                                volume_metrics: Dict, sentiment_data: Dict) -> float:
+                                volume_metrics: Dict, sentiment_data: Dict,
+                                platform_count: int = None, current_time: datetime = None) -> float:
         """Apply additional scoring modifiers based on various factors"""
         modified_score = base_score
         
         # Recency boost - more recent activity gets higher scores
         if self.recency_boost:
-            recency_multiplier = self._calculate_recency_multiplier(posts)
+            recency_multiplier = self._calculate_recency_multiplier(posts, current_time)
             modified_score *= recency_multiplier
         
         # Cross-platform bonus
         if self.cross_platform_bonus:
-            platform_count = len(set(post.get('source', '') for post in posts))
+            if platform_count is None:
+                platform_count = len(set(post.get('source', '') for post in posts))
             if platform_count > 1:
                 cross_platform_multiplier = 1.0 + (platform_count - 1) * 0.15  # 15% boost per additional platform
                 modified_score *= cross_platform_multiplier
         
         # Engagement multiplier
         if self.engagement_multiplier:
-            avg_engagement = sum(post.get('engagement_score', 0) for post in posts) / len(posts)
+            engagement = np.fromiter((post.get('engagement_score', 0) for post in posts),
+                                     dtype=np.float64, count=len(posts))
+            avg_engagement = float(engagement.mean())
             engagement_multiplier = 1.0 + min(avg_engagement / 100.0, 0.5)  # Cap at 50% boost
             modified_score *= engagement_multiplier
         
@@ -184,38 +210,37 @@ class HypeScorer:
         
         return modified_score
     
-    def _calculate_recency_multiplier(self, posts: List[Dict]) -> float:
+    def _calculate_recency_multiplier(self, posts: List[Dict], current_time: datetime = None) -> float:
         """Calculate multiplier based on how recent the posts are"""
         if not posts:
             return 1.0
         
-        current_time = datetime.now()
-        total_recency_score = 0.0
-        valid_posts = 0
+        if current_time is None:
+            current_time = datetime.now()
+        post_times = []
         
         for post in posts:
             timestamp_str = post.get('timestamp')
             if timestamp_str:
                 try:
-                    post_time = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+                    post_time = parse_timestamp(timestamp_str)
                     if post_time.tzinfo:
                         post_time = post_time.replace(tzinfo=None)
-                    
-                    hours_ago = (current_time - post_time).total_seconds() / 3600.0
-                    
-                    # Exponential decay: newer posts get higher scores
-                    recency_score = math.exp(-hours_ago / 12.0)  # Half-life of 12 hours
-                    total_recency_score += recency_score
-                    valid_posts += 1
+                    post_times.append(post_time)
                     
                 except Exception as e:
-                    self.logger.debug(f"Error parsing timestamp for recency: {e}")
+                    self.logger.debug("Error parsing timestamp for recency: %s", e)
                     continue
         
-        if valid_posts == 0:
+        if not post_times:
             return 1.0
         
-        avg_recency = total_recency_score / valid_posts
+        # Ages in hours for all posts at once
+        hours_ago = ((np.datetime64(current_time, 'us') - np.array(post_times, dtype='datetime64[us]'))
+                     / np.timedelta64(1, 'h'))
+        
+        # Exponential decay: newer posts get higher scores
+        avg_recency = float(np.exp(-hours_ago / 12.0).mean())  # Half-life of 12 hours
         # Convert to multiplier range 0.5 to 1.5
         return 0.5 + avg_recency
     
@@ -224,11 +249,11 @@ class HypeScorer:
         if not posts:
             return []
         
-        # Sort by engagement score descending
-        sorted_posts = sorted(posts, key=lambda x: x.get('engagement_score', 0), reverse=True)
+        # Highest engagement first
+        top_posts = heapq.nlargest(count, posts, key=lambda x: x.get('engagement_score', 0))
         
         sample_posts = []
-        for post in sorted_posts[:count]:
+        for post in top_posts:
             sample_post = {
                 'text': post.get('text', '')[:200] + ('...' if len(post.get('text', '')) > 200 else ''),
                 'source': post.get('source', ''),
@@ -245,24 +270,25 @@ class HypeScorer:
         if not results:
             return {'total_tickers': 0}
         
-        total_mentions = sum(result['mention_count'] for result in results)
-        avg_hype_score = sum(result['hype_score'] for result in results) / len(results)
-        avg_sentiment = sum(result['sentiment_score'] for result in results) / len(results)
-        avg_volume = sum(result['volume_score'] for result in results) / len(results)
-        
-        # Platform distribution
-        all_platforms = []
+        # Totals, platform distribution and sentiment trend distribution in one pass
+        total_mentions = 0
+        total_hype = 0.0
+        total_sentiment = 0.0
+        total_volume = 0.0
+        platform_counts = Counter()
+        trend_counts = Counter()
         for result in results:
-            all_platforms.extend(result['platforms'])
-        platform_counts = {}
-        for platform in all_platforms:
-            platform_counts[platform] = platform_counts.get(platform, 0) + 1
+            total_mentions += result['mention_count']
+            total_hype += result['hype_score']
+            total_sentiment += result['sentiment_score']
+            total_volume += result['volume_score']
+            
+            platform_counts.update(result['platforms'])
+            trend_counts[result['sentiment_trend']] += 1
         
-        # Sentiment trend distribution
-        trend_counts = {}
-        for result in results:
-            trend = result['sentiment_trend']
-            trend_counts[trend] = trend_counts.get(trend, 0) + 1
+        avg_hype_score = total_hype / len(results)
+        avg_sentiment = total_sentiment / len(results)
+        avg_volume = total_volume / len(results)
         
         return {
             'total_tickers': len(results),
@@ -272,12 +298,13 @@ class HypeScorer:
             'avg_volume_score': avg_volume,
             'top_ticker': results[0]['ticker'] if results else None,
             'top_hype_score': results[0]['hype_score'] if results else 0,
-            'platform_distribution': platform_counts,
-            'sentiment_trend_distribution': trend_counts,
+            'platform_distribution': dict(platform_counts),
+            'sentiment_trend_distribution': dict(trend_counts),
             'scoring_weights': {
                 'volume_weight': self.volume_weight,
                 'sentiment_weight': self.sentiment_weight
             },
+            'sentiment_cache': self.sentiment_scorer.get_cache_stats(),
             'timestamp': datetime.now().isoformat()
         }
     
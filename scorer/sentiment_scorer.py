@@ -1,10 +1,32 @@
 from typing import Dict, List, Any, Tuple
-from textblob import TextBlob
+from textblob.en import sentiment as pattern_sentiment
+import numpy as np
+import os
 import re
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 from utils.logger import setup_logger
+from utils.time_utils import parse_timestamp
 from parser.text_cleaner import TextCleaner
 
+SENTIMENT_CACHE_SIZE = 65536
+
+# Below this many posts, worker start-up costs more than scoring in-process
+_PARALLEL_MIN_POSTS = 1000
+
+# Shortest score list for which np.std beats the pure-Python two-pass variance
+_NUMPY_STD_MIN_SIZE = 256
+
+@lru_cache(maxsize=SENTIMENT_CACHE_SIZE)
+def _textblob_sentiment(text: str) -> Tuple[float, float]:
+    """TextBlob polarity and subjectivity, memoized per distinct text"""
+    # Same scorer TextBlob(text).sentiment ends up in, minus the blob set-up and
+    # the namedtuple class PatternAnalyzer.analyze builds on every call
+    polarity, subjectivity = pattern_sentiment(text)
+    return polarity, subjectivity
+
 class SentimentScorer:
     """Calculates sentiment scores for ticker mentions"""
     
@@ -12,6 +34,7 @@ class SentimentScorer:
         self.config = config or {}
         self.logger = setup_logger('SentimentScorer')
         self.text_cleaner = TextCleaner()
+        self.workers = self.config.get('workers', 1)  # Scoring processes; None uses every CPU
         
         # Sentiment keywords and weights
         self.positive_keywords = {
@@ -72,14 +95,34 @@ class SentimentScorer:
             'not', 'no', 'never', 'none', 'nothing', 'neither', 'nowhere',
             'nobody', 'hardly', 'scarcely', 'barely', 'rarely'
         }
+        
+        # Lookup tables merged once so each word needs a single dict probe; positive
+        # and intensifier entries win on overlap since they were checked first
+        self._keyword_scores = {**self.negative_keywords, **self.positive_keywords}
+        self._modifier_factors = {**self.diminishers, **self.intensifiers}
+        
+        # First words of multi-word keywords; only these need a two-word probe
+        self._phrase_first_words = {phrase.split()[0] for phrase in self._keyword_scores if ' ' in phrase}
+        
+        # Keyword scores depend only on the text, so repeated contexts (the same post
+        # mentioning a ticker twice, retweets, crossposts) are scored once
+        self._cached_keyword_sentiment = lru_cache(
+            maxsize=self.config.get('cache_size', SENTIMENT_CACHE_SIZE)
+        )(self._keyword_sentiment)
+        
+        # Compiled per-ticker mention patterns, built on first use
+        self._ticker_res: Dict[str, re.Pattern] = {}
+        
+        # Cache hits/misses of worker processes from earlier parallel calls; their
+        # caches are discarded with the pool, so only the counts are kept
+        self._worker_cache_stats: Dict[str, Counter] = {}
     
     def analyze_text_sentiment(self, text: str) -> Tuple[float, float]:
         """Analyze sentiment using TextBlob (returns polarity, subjectivity)"""
         try:
-            blob = TextBlob(text)
-            return blob.sentiment.polarity, blob.sentiment.subjectivity
+            return _textblob_sentiment(text)
         except Exception as e:
-            self.logger.debug(f"TextBlob sentiment analysis failed: {e}")
+            self.logger.debug("TextBlob sentiment analysis failed: %s", e)
             return 0.0, 0.0
     
     def calculate_keyword_sentiment(self, text: str, ticker: str = None) -> float:
@@ -87,6 +130,10 @@ class SentimentScorer:
         if not text:
             return 0.0
         
+        return self._cached_keyword_sentiment(text)
+    
+    def _keyword_sentiment(self, text: str) -> float:
+        """Uncached keyword scoring behind calculate_keyword_sentiment"""
         # Clean and normalize text
         cleaned_text = self.text_cleaner.clean_for_sentiment_analysis(text)
         words = cleaned_text.lower().split()
@@ -97,30 +144,22 @@ class SentimentScorer:
         if word_count == 0:
             return 0.0
         
+        keyword_scores = self._keyword_scores
         i = 0
-        while i < len(words):
+        while i < word_count:
             word = words[i]
             
             # Check for multi-word phrases first
-            if i < len(words) - 1:
-                two_word_phrase = f"{word} {words[i + 1]}"
-                if two_word_phrase in self.positive_keywords:
-                    score = self.positive_keywords[two_word_phrase]
-                    sentiment_score += self._apply_context_modifiers(words, i, score)
-                    i += 2
-                    continue
-                elif two_word_phrase in self.negative_keywords:
-                    score = self.negative_keywords[two_word_phrase]
+            if word in self._phrase_first_words and i < word_count - 1:
+                score = keyword_scores.get(f"{word} {words[i + 1]}")
+                if score is not None:
                     sentiment_score += self._apply_context_modifiers(words, i, score)
                     i += 2
                     continue
             
             # Check single words
-            if word in self.positive_keywords:
-                score = self.positive_keywords[word]
-                sentiment_score += self._apply_context_modifiers(words, i, score)
-            elif word in self.negative_keywords:
-                score = self.negative_keywords[word]
+            score = keyword_scores.get(word)
+            if score is not None:
                 sentiment_score += self._apply_context_modifiers(words, i, score)
             
             i += 1
@@ -143,66 +182,63 @@ class SentimentScorer:
         context_words = words[start_pos:end_pos]
         
         # Check for negators first (they flip the sign)
-        negated = False
-        for word in context_words:
-            if word in self.negators:
-                negated = True
-                break
-        
-        if negated:
+        if not self.negators.isdisjoint(context_words):
             modified_score = -modified_score * 0.8  # Negated but slightly reduced
         
         # Apply intensifiers and diminishers
         for word in context_words:
-            if word in self.intensifiers:
-                modified_score *= self.intensifiers[word]
-            elif word in self.diminishers:
-                modified_score *= self.diminishers[word]
+            factor = self._modifier_factors.get(word)
+            if factor is not None:
+                modified_score *= factor
         
         return modified_score
     
+    def _get_ticker_re(self, ticker: str) -> re.Pattern:
+        """Case-insensitive pattern for every (overlapping) mention of a ticker"""
+        ticker_re = self._ticker_res.get(ticker)
+        if ticker_re is None:
+            # Zero-width lookahead keeps overlapping hits, matching a find loop that
+            # resumes one character past each mention
+            ticker_re = self._ticker_res.setdefault(ticker, re.compile(f"(?={re.escape(ticker)})", re.IGNORECASE))
+        return ticker_re
+    
     def calculate_ticker_context_sentiment(self, posts: List[Dict], ticker: str) -> Dict[str, Any]:
         """Calculate sentiment specifically in the context of ticker mentions"""
         if not posts:
             return {'sentiment_score': 0.0, 'confidence': 0.0, 'post_count': 0}
         
-        ticker_contexts = []
+        return self._summarize_context_sentiment(len(posts), self._score_post_contexts(posts, ticker))
+    
+    def _score_post_contexts(self, posts: List[Dict], ticker: str) -> List[List[Tuple[float, float]]]:
+        """Score every context around ticker mentions, grouped per post as (keyword, textblob) pairs"""
+        post_scores = []
         
         # Extract contexts around ticker mentions
+        ticker_re = self._get_ticker_re(ticker)
         for post in posts:
             text = post.get('text', '')
-            if ticker.upper() in text.upper():
-                # Find ticker position and extract surrounding context
-                text_upper = text.upper()
-                ticker_positions = []
-                start = 0
-                while True:
-                    pos = text_upper.find(ticker.upper(), start)
-                    if pos == -1:
-                        break
-                    ticker_positions.append(pos)
-                    start = pos + 1
+            scores = []
+            for match in ticker_re.finditer(text):
+                # Extract context window around ticker
+                pos = match.start()
+                context_start = max(0, pos - 100)
+                context_end = min(len(text), pos + len(ticker) + 100)
+                context = text[context_start:context_end]
                 
-                for pos in ticker_positions:
-                    # Extract context window around ticker
-                    context_start = max(0, pos - 100)
-                    context_end = min(len(text), pos + len(ticker) + 100)
-                    context = text[context_start:context_end]
-                    ticker_contexts.append(context)
-        
-        if not ticker_contexts:
-            return {'sentiment_score': 0.0, 'confidence': 0.0, 'post_count': 0}
+                keyword_score = self.calculate_keyword_sentiment(context, ticker)
+                textblob_polarity, textblob_subjectivity = self.analyze_text_sentiment(context)
+                scores.append((keyword_score, textblob_polarity))
+            post_scores.append(scores)
         
-        # Calculate sentiment for each context
-        keyword_scores = []
-        textblob_scores = []
+        return post_scores
+    
+    def _summarize_context_sentiment(self, post_count: int, post_scores: List[List[Tuple[float, float]]]) -> Dict[str, Any]:
+        """Aggregate per-context scores from _score_post_contexts into context sentiment metrics"""
+        keyword_scores = [keyword for scores in post_scores for keyword, _ in scores]
+        textblob_scores = [textblob for scores in post_scores for _, textblob in scores]
         
-        for context in ticker_contexts:
-            keyword_score = self.calculate_keyword_sentiment(context, ticker)
-            textblob_polarity, textblob_subjectivity = self.analyze_text_sentiment(context)
-            
-            keyword_scores.append(keyword_score)
-            textblob_scores.append(textblob_polarity)
+        if not keyword_scores:
+            return {'sentiment_score': 0.0, 'confidence': 0.0, 'post_count': 0}
         
         # Combine keyword and TextBlob scores
         avg_keyword = sum(keyword_scores) / len(keyword_scores)
@@ -221,37 +257,58 @@ class SentimentScorer:
         return {
             'sentiment_score': combined_score,
             'confidence': confidence,
-            'post_count': len(posts),
-            'context_count': len(ticker_contexts),
+            'post_count': post_count,
+            'context_count': len(keyword_scores),
             'keyword_sentiment': avg_keyword,
             'textblob_sentiment': avg_textblob,
             'keyword_std': keyword_std,
             'textblob_std': textblob_std
         }
     
+    def get_cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """Hit/miss counts for the keyword and TextBlob sentiment caches
+        
+        Hits and misses include those of worker processes; size is the number of
+        entries cached in this process.
+        """
+        stats = {}
+        for name, info in (('keyword', self._cached_keyword_sentiment.cache_info()),
+                           ('textblob', _textblob_sentiment.cache_info())):
+            worker_stats = self._worker_cache_stats.get(name, Counter())
+            stats[name] = {
+                'hits': info.hits + worker_stats['hits'],
+                'misses': info.misses + worker_stats['misses'],
+                'size': info.currsize
+            }
+        return stats
+    
     def _calculate_std(self, values: List[float]) -> float:
         """Calculate standard deviation"""
         if len(values) < 2:
             return 0.0
         
+        # numpy's call overhead only pays off on longer lists
+        if len(values) >= _NUMPY_STD_MIN_SIZE:
+            return float(np.std(values))
+        
         mean = sum(values) / len(values)
         variance = sum((x - mean) ** 2 for x in values) / len(values)
         return variance ** 0.5
     
-    def calculate_sentiment_trend(self, posts: List[Dict], ticker: str) -> Dict[str, Any]:
-        """Calculate sentiment trend over time"""
+    def calculate_sentiment_trend(self, posts: List[Dict], ticker: str,
+                                  post_scores: List[List[Tuple[float, float]]] = None) -> Dict[str, Any]:
+        """Calculate sentiment trend over time, reusing post_scores from _score_post_contexts if given"""
         if not posts:
             return {'trend': 'neutral', 'trend_strength': 0.0}
         
         # Sort posts by timestamp
         timestamped_posts = []
-        for post in posts:
+        for index, post in enumerate(posts):
             timestamp_str = post.get('timestamp')
             if timestamp_str:
                 try:
-                    from datetime import datetime
-                    timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                    timestamped_posts.append((timestamp, post))
+                    timestamp = parse_timestamp(timestamp_str)
+                    timestamped_posts.append((timestamp, index))
                 except Exception:
                     continue
         
@@ -268,11 +325,14 @@ class SentimentScorer:
         # Split into early and late periods
         mid_time = timestamped_posts[0][0] + total_time / 2
         
-        early_posts = [post for timestamp, post in timestamped_posts if timestamp <= mid_time]
-        late_posts = [post for timestamp, post in timestamped_posts if timestamp > mid_time]
+        if post_scores is None:
+            post_scores = self._score_post_contexts(posts, ticker)
         
-        early_sentiment = self.calculate_ticker_context_sentiment(early_posts, ticker)
-        late_sentiment = self.calculate_ticker_context_sentiment(late_posts, ticker)
+        early_scores = [post_scores[index] for timestamp, index in timestamped_posts if timestamp <= mid_time]
+        late_scores = [post_scores[index] for timestamp, index in timestamped_posts if timestamp > mid_time]
+        
+        early_sentiment = self._summarize_context_sentiment(len(early_scores), early_scores)
+        late_sentiment = self._summarize_context_sentiment(len(late_scores), late_scores)
         
         early_score = early_sentiment['sentiment_score']
         late_score = late_sentiment['sentiment_score']
@@ -295,59 +355,112 @@ class SentimentScorer:
             'trend_change': trend_change
         }
     
-    def calculate_comprehensive_sentiment_score(self, ticker_posts: Dict[str, List[Dict]]) -> Dict[str, Dict[str, Any]]:
-        """Calculate comprehensive sentiment scores for all tickers"""
-        sentiment_scores = {}
-        
-        for ticker, posts in ticker_posts.items():
-            if not posts:
-                sentiment_scores[ticker] = {
-                    'sentiment_score': 0.0,
-                    'confidence': 0.0,
-                    'post_count': 0
-                }
-                continue
-            
-            # Calculate main sentiment metrics
-            context_sentiment = self.calculate_ticker_context_sentiment(posts, ticker)
-            trend_analysis = self.calculate_sentiment_trend(posts, ticker)
-            
-            # Calculate source-weighted sentiment
-            source_weights = {'twitter': 1.0, 'reddit': 1.2, 'reddit_comment': 0.8}
-            weighted_sentiment = 0.0
-            total_weight = 0.0
-            
-            for post in posts:
-                post_text = post.get('text', '')
-                post_sentiment = self.calculate_keyword_sentiment(post_text, ticker)
-                source = post.get('source', 'unknown')
-                weight = source_weights.get(source, 1.0)
-                
-                weighted_sentiment += post_sentiment * weight
-                total_weight += weight
-            
-            if total_weight > 0:
-                weighted_sentiment /= total_weight
-            
-            # Combine all sentiment metrics
-            final_sentiment = (
-                context_sentiment['sentiment_score'] * 0.5 +
-                weighted_sentiment * 0.3 +
-                (1.0 if trend_analysis['trend'] == 'improving' else 
-                 -1.0 if trend_analysis['trend'] == 'declining' else 0.0) * 
-                trend_analysis['trend_strength'] * 0.2
-            )
-            
-            sentiment_scores[ticker] = {
-                'sentiment_score': final_sentiment,
+    def calculate_comprehensive_sentiment_score(self, ticker_posts: Dict[str, List[Dict]],
+                                                min_confidence: float = None) -> Dict[str, Dict[str, Any]]:
+        """Calculate comprehensive sentiment scores for all tickers
+        
+        Worker processes are opt-in (config 'workers' > 1, or None for every CPU). The pool
+        is created per call, forks the calling process on Linux (unsafe while other threads
+        are running), pickles every ticker's posts to the workers and discards their caches.
+        """
+        workers = self.workers if self.workers is not None else (os.cpu_count() or 1)
+        total_posts = sum(len(posts) for posts in ticker_posts.values())
+        
+        if workers <= 1 or len(ticker_posts) <= 1 or total_posts <= _PARALLEL_MIN_POSTS:
+            return {ticker: self._score_ticker_sentiment(ticker, posts, min_confidence)
+                    for ticker, posts in ticker_posts.items()}
+        
+        # Tickers are scored independently; each worker process builds its own scorer once
+        items = list(ticker_posts.items())
+        workers = min(workers, len(items))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker_scorer,
+                                 initargs=(self.config,)) as executor:
+            results = list(executor.map(_score_ticker_item, items, repeat(min_confidence),
+                                        chunksize=max(1, len(items) // (workers * 4))))
+        
+        # Each worker's cache counts are cumulative and its results come back in the order
+        # it scored them, so the last counts seen per worker are its totals for this call
+        final_worker_stats = {pid: stats for pid, stats, _ in results}
+        for stats in final_worker_stats.values():
+            for name, counts in stats.items():
+                self._worker_cache_stats.setdefault(name, Counter()).update(
+                    hits=counts['hits'], misses=counts['misses'])
+        
+        return {ticker: score for ticker, (_, _, score) in zip(ticker_posts, results)}
+    
+    def _score_ticker_sentiment(self, ticker: str, posts: List[Dict], min_confidence: float = None) -> Dict[str, Any]:
+        """Calculate the comprehensive sentiment score for one ticker's posts"""
+        if not posts:
+            return {
+                'sentiment_score': 0.0,
+                'confidence': 0.0,
+                'post_count': 0
+            }
+        
+        # Score each mention context once; context and trend metrics both aggregate it
+        post_scores = self._score_post_contexts(posts, ticker)
+        context_sentiment = self._summarize_context_sentiment(len(posts), post_scores)
+        
+        # Tickers below min_confidence get dropped by the caller, so skip the trend and
+        # source-weighted passes for them
+        if min_confidence is not None and context_sentiment['confidence'] < min_confidence:
+            return {
+                'sentiment_score': context_sentiment['sentiment_score'],
                 'confidence': context_sentiment['confidence'],
-                'post_count': len(posts),
-                'context_sentiment': context_sentiment['sentiment_score'],
-                'weighted_sentiment': weighted_sentiment,
-                'trend': trend_analysis['trend'],
-                'trend_strength': trend_analysis['trend_strength'],
-                'keyword_sentiment': context_sentiment.get('keyword_sentiment', 0.0),
-                'textblob_sentiment': context_sentiment.get('textblob_sentiment', 0.0)
+                'post_count': len(posts)
             }
         
-        return sentiment_scores 
\ No newline at end of file
+        trend_analysis = self.calculate_sentiment_trend(posts, ticker, post_scores)
+        
+        # Calculate source-weighted sentiment
+        source_weights = {'twitter': 1.0, 'reddit': 1.2, 'reddit_comment': 0.8}
+        weighted_sentiment = 0.0
+        total_weight = 0.0
+        
+        for post in posts:
+            post_text = post.get('text', '')
+            post_sentiment = self.calculate_keyword_sentiment(post_text, ticker)
+            source = post.get('source', 'unknown')
+            weight = source_weights.get(source, 1.0)
+            
+            weighted_sentiment += post_sentiment * weight
+            total_weight += weight
+        
+        if total_weight > 0:
+            weighted_sentiment /= total_weight
+        
+        # Combine all sentiment metrics
+        final_sentiment = (
+            context_sentiment['sentiment_score'] * 0.5 +
+            weighted_sentiment * 0.3 +
+            (1.0 if trend_analysis['trend'] == 'improving' else 
+             -1.0 if trend_analysis['trend'] == 'declining' else 0.0) * 
+            trend_analysis['trend_strength'] * 0.2
+        )
+        
+        return {
+            'sentiment_score': final_sentiment,
+            'confidence': context_sentiment['confidence'],
+            'post_count': len(posts),
+            'context_sentiment': context_sentiment['sentiment_score'],
+            'weighted_sentiment': weighted_sentiment,
+            'trend': trend_analysis['trend'],
+            'trend_strength': trend_analysis['trend_strength'],
+            'keyword_sentiment': context_sentiment.get('keyword_sentiment', 0.0),
+            'textblob_sentiment': context_sentiment.get('textblob_sentiment', 0.0)
+        }
+
+# Scorer owned by each calculate_comprehensive_sentiment_score worker process
+_worker_scorer = None
+
+def _init_worker_scorer(config: Dict[str, Any]) -> None:
+    """Build the worker's SentimentScorer once, when the worker process starts"""
+    global _worker_scorer
+    _worker_scorer = SentimentScorer(config)
+
+def _score_ticker_item(item: Tuple[str, List[Dict]],
+                       min_confidence: float = None) -> Tuple[int, Dict[str, Dict[str, int]], Dict[str, Any]]:
+    """Score one (ticker, posts) pair inside a worker process, with the worker's cache counts"""
+    ticker, posts = item
+    score = _worker_scorer._score_ticker_sentiment(ticker, posts, min_confidence)
+    return os.getpid(), _worker_scorer.get_cache_stats(), score
@@ -1,8 +1,12 @@
 from typing import Dict, List, Any
-from collections import Counter, defaultdict
 from datetime import datetime, timedelta
 import math
+import numpy as np
 from utils.logger import setup_logger
+from utils.time_utils import parse_timestamp
+
+# Reference point for naive post times; whole hours since it line up with clock hours
+_EPOCH = datetime(1970, 1, 1)
 
 class VolumeScorer:
     """Calculates volume-based scoring for ticker symbols"""
@@ -22,169 +26,143 @@ class VolumeScorer:
     
     def calculate_raw_volume(self, ticker_posts: Dict[str, List[Dict]]) -> Dict[str, float]:
         """Calculate raw mention volume for each ticker"""
-        volume_scores = {}
-        
-        for ticker, posts in ticker_posts.items():
-            raw_count = len(posts)
-            volume_scores[ticker] = float(raw_count)
-        
-        return volume_scores
+        return self.calculate_all_components(ticker_posts)['raw']
     
     def calculate_weighted_volume(self, ticker_posts: Dict[str, List[Dict]]) -> Dict[str, float]:
         """Calculate volume with source weighting and engagement consideration"""
-        volume_scores = {}
-        
-        for ticker, posts in ticker_posts.items():
-            weighted_score = 0.0
-            
-            for post in posts:
-                # Base score from source
-                source = post.get('source', 'unknown')
-                source_weight = self.source_weights.get(source, 1.0)
-                
-                # Engagement multiplier
-                engagement = post.get('engagement_score', 0)
-                engagement_multiplier = 1.0 + (engagement * self.engagement_weight / 100.0)
-                
-                # Combined score for this post
-                post_score = source_weight * engagement_multiplier
-                weighted_score += post_score
-            
-            volume_scores[ticker] = weighted_score
-        
-        return volume_scores
+        return self.calculate_all_components(ticker_posts)['weighted']
     
     def calculate_time_weighted_volume(self, ticker_posts: Dict[str, List[Dict]]) -> Dict[str, float]:
         """Calculate volume with time decay (recent posts weighted higher)"""
-        volume_scores = {}
-        current_time = datetime.now()
-        
-        for ticker, posts in ticker_posts.items():
-            time_weighted_score = 0.0
-            
-            for post in posts:
-                # Calculate time decay
-                time_weight = 1.0
-                timestamp_str = post.get('timestamp')
-                
-                if timestamp_str:
-                    try:
-                        post_time = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                        # Remove timezone info for comparison
-                        if post_time.tzinfo:
-                            post_time = post_time.replace(tzinfo=None)
-                        
-                        hours_ago = (current_time - post_time).total_seconds() / 3600.0
-                        time_weight = math.pow(self.time_decay_factor, hours_ago)
-                    except Exception as e:
-                        self.logger.debug(f"Error parsing timestamp {timestamp_str}: {e}")
-                
-                # Source and engagement weights
-                source = post.get('source', 'unknown')
-                source_weight = self.source_weights.get(source, 1.0)
-                
-                engagement = post.get('engagement_score', 0)
-                engagement_multiplier = 1.0 + (engagement * self.engagement_weight / 100.0)
-                
-                # Combined score for this post
-                post_score = source_weight * engagement_multiplier * time_weight
-                time_weighted_score += post_score
-            
-            volume_scores[ticker] = time_weighted_score
-        
-        return volume_scores
+        return self.calculate_all_components(ticker_posts)['time_weighted']
     
     def calculate_velocity_score(self, ticker_posts: Dict[str, List[Dict]]) -> Dict[str, float]:
         """Calculate mention velocity (mentions per hour in recent period)"""
-        velocity_scores = {}
-        current_time = datetime.now()
-        
-        # Look at last 4 hours for velocity calculation
-        velocity_window_hours = 4
-        
-        for ticker, posts in ticker_posts.items():
-            recent_posts = []
-            
-            for post in posts:
-                timestamp_str = post.get('timestamp')
-                if timestamp_str:
-                    try:
-                        post_time = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                        if post_time.tzinfo:
-                            post_time = post_time.replace(tzinfo=None)
-                        
-                        hours_ago = (current_time - post_time).total_seconds() / 3600.0
-                        
-                        if hours_ago <= velocity_window_hours:
-                            recent_posts.append(post)
-                    except Exception as e:
-                        self.logger.debug(f"Error parsing timestamp for velocity: {e}")
-            
-            # Calculate velocity (mentions per hour)
-            velocity = len(recent_posts) / velocity_window_hours
-            velocity_scores[ticker] = velocity
-        
-        return velocity_scores
+        return self.calculate_all_components(ticker_posts)['velocity']
     
     def calculate_spike_detection(self, ticker_posts: Dict[str, List[Dict]]) -> Dict[str, float]:
         """Detect sudden spikes in mention volume"""
-        spike_scores = {}
-        current_time = datetime.now()
-        
-        for ticker, posts in ticker_posts.items():
-            # Separate posts into time buckets (1-hour intervals)
-            hourly_counts = defaultdict(int)
-            
-            for post in posts:
-                timestamp_str = post.get('timestamp')
-                if timestamp_str:
-                    try:
-                        post_time = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                        if post_time.tzinfo:
-                            post_time = post_time.replace(tzinfo=None)
-                        
-                        # Round to hour bucket
-                        hour_bucket = post_time.replace(minute=0, second=0, microsecond=0)
-                        hourly_counts[hour_bucket] += 1
-                    except Exception as e:
-                        continue
-            
-            if not hourly_counts:
-                spike_scores[ticker] = 0.0
-                continue
-            
-            # Calculate spike score
-            counts = list(hourly_counts.values())
-            if len(counts) < 2:
-                spike_scores[ticker] = 0.0
-                continue
-            
-            avg_count = sum(counts) / len(counts)
-            recent_count = max(counts) if counts else 0
-            
-            # Spike ratio (recent peak vs average)
-            spike_ratio = recent_count / avg_count if avg_count > 0 else 1.0
-            spike_scores[ticker] = spike_ratio
-        
-        return spike_scores
+        return self.calculate_all_components(ticker_posts)['spike']
     
     def calculate_cross_platform_boost(self, ticker_posts: Dict[str, List[Dict]]) -> Dict[str, float]:
         """Boost score for tickers mentioned across multiple platforms"""
-        boost_scores = {}
+        return self.calculate_all_components(ticker_posts)['cross_platform']
+    
+    def _post_seconds(self, timestamp_str: str) -> float:
+        """Naive post time as seconds since 1970-01-01, NaN if the timestamp is missing or unparseable"""
+        if timestamp_str:
+            try:
+                post_time = parse_timestamp(timestamp_str)
+                # Remove timezone info for comparison
+                if post_time.tzinfo:
+                    post_time = post_time.replace(tzinfo=None)
+                
+                return (post_time - _EPOCH).total_seconds()
+            except Exception as e:
+                self.logger.debug("Error parsing timestamp %s: %s", timestamp_str, e)
+        
+        return math.nan
+    
+    def calculate_all_components(self, ticker_posts: Dict[str, List[Dict]]) -> Dict[str, Dict[str, Any]]:
+        """Compute every volume component, plus the per-ticker detail metrics, in one pass over the posts"""
+        components = {name: {} for name in (
+            'raw', 'weighted', 'time_weighted', 'velocity', 'spike', 'cross_platform',
+            'total_engagement', 'platform_distribution', 'unique_authors'
+        )}
+        current_seconds = (datetime.now() - _EPOCH).total_seconds()
+        
+        # Look at last 4 hours for velocity calculation
+        velocity_window_hours = 4
+        
+        # decay ** hours as exp(log(decay) * hours), with the log taken once per call
+        log_decay = math.log(self.time_decay_factor) if self.time_decay_factor > 0 else None
+        
+        # Sources get small integer ids in order of first appearance so per-post
+        # weights and platform counts come from array indexing instead of dict lookups
+        source_ids = {}
+        source_weight_arr = np.empty(0, dtype=np.float64)
+        to_post_seconds = self._post_seconds
         
         for ticker, posts in ticker_posts.items():
-            sources = set()
+            post_seconds = []
+            post_source_ids = []
+            engagements = []
+            authors = set()
+            total_engagement = 0
+            
             for post in posts:
                 source = post.get('source', 'unknown')
-                sources.add(source)
+                engagement = post.get('engagement_score', 0)
+                
+                post_seconds.append(to_post_seconds(post.get('timestamp')))
+                post_source_ids.append(source_ids.setdefault(source, len(source_ids)))
+                engagements.append(engagement)
+                authors.add(post.get('author', ''))
+                total_engagement += engagement
+            
+            post_seconds = np.array(post_seconds, dtype=np.float64)
+            hours_ago = (current_seconds - post_seconds) / 3600.0
+            post_source_ids = np.array(post_source_ids, dtype=np.intp)
+            
+            # Weight table indexed by source id, extended as new sources show up
+            if len(source_weight_arr) < len(source_ids):
+                source_weight_arr = np.array([self.source_weights.get(source, 1.0) for source in source_ids],
+                                             dtype=np.float64)
+            
+            # Source weight times engagement multiplier per post
+            weights = source_weight_arr[post_source_ids] * (
+                1.0 + (np.array(engagements, dtype=np.float64) * self.engagement_weight / 100.0)
+            )
+            
+            # Time decay for every post at once; posts without a usable timestamp keep full weight
+            if log_decay is not None:
+                decay = np.exp(log_decay * hours_ago)
+            else:
+                decay = np.power(self.time_decay_factor, hours_ago)
+            time_weights = np.where(np.isnan(hours_ago), 1.0, decay)
+            
+            # NaN ages (unusable timestamps) never fall inside the velocity window
+            recent_count = int(np.count_nonzero(hours_ago <= velocity_window_hours))
+            
+            components['raw'][ticker] = float(len(posts))
+            components['weighted'][ticker] = float(weights.sum())
+            components['time_weighted'][ticker] = float((weights * time_weights).sum())
+            components['velocity'][ticker] = recent_count / velocity_window_hours
+            components['spike'][ticker] = self._spike_ratio(post_seconds)
+            
+            # Per-source post counts, keyed by name in order of first appearance for this ticker
+            source_counts = np.bincount(post_source_ids, minlength=len(source_ids))
+            present_ids = np.unique(post_source_ids, return_index=True)
+            source_names = list(source_ids)
+            sources = {source_names[i]: int(source_counts[i])
+                       for i in present_ids[0][np.argsort(present_ids[1])].tolist()}
             
             # Cross-platform multiplier
             platform_count = len(sources)
-            cross_platform_boost = 1.0 + (platform_count - 1) * 0.2  # 20% boost per additional platform
+            components['cross_platform'][ticker] = 1.0 + (platform_count - 1) * 0.2  # 20% boost per additional platform
             
-            boost_scores[ticker] = cross_platform_boost
+            components['total_engagement'][ticker] = total_engagement
+            components['platform_distribution'][ticker] = sources
+            components['unique_authors'][ticker] = len(authors)
         
-        return boost_scores
+        return components
+    
+    def _spike_ratio(self, post_seconds: np.ndarray) -> float:
+        """Peak hourly mention count relative to the average over active hours"""
+        # Separate posts into time buckets (1-hour intervals); whole hours since the
+        # epoch are the same buckets as truncating each naive time to the hour
+        hour_buckets = (post_seconds[~np.isnan(post_seconds)] // 3600).astype(np.int64)
+        counts = np.unique(hour_buckets, return_counts=True)[1]
+        
+        # Calculate spike score
+        if counts.size < 2:
+            return 0.0
+        
+        avg_count = int(counts.sum()) / counts.size
+        recent_count = int(counts.max())
+        
+        # Spike ratio (recent peak vs average)
+        return recent_count / avg_count if avg_count > 0 else 1.0
     
     def normalize_scores(self, scores: Dict[str, float]) -> Dict[str, float]:
         """Normalize scores to 0-1 range"""
@@ -203,27 +181,17 @@ class VolumeScorer:
         
         return normalized
     
-    def calculate_comprehensive_volume_score(self, ticker_posts: Dict[str, List[Dict]]) -> Dict[str, float]:
-        """Calculate comprehensive volume score combining all metrics"""
+    def calculate_comprehensive_volume_score(self, ticker_posts: Dict[str, List[Dict]],
+                                             components: Dict[str, Dict[str, Any]] = None) -> Dict[str, float]:
+        """Calculate comprehensive volume score combining all metrics (reusing components if given)"""
         if not ticker_posts:
             return {}
         
-        # Calculate individual components
-        raw_volume = self.calculate_raw_volume(ticker_posts)
-        weighted_volume = self.calculate_weighted_volume(ticker_posts)
-        time_weighted = self.calculate_time_weighted_volume(ticker_posts)
-        velocity = self.calculate_velocity_score(ticker_posts)
-        spike_detection = self.calculate_spike_detection(ticker_posts)
-        cross_platform = self.calculate_cross_platform_boost(ticker_posts)
-        
-        # Normalize individual components
-        norm_raw = self.normalize_scores(raw_volume)
-        norm_weighted = self.normalize_scores(weighted_volume)
-        norm_time = self.normalize_scores(time_weighted)
-        norm_velocity = self.normalize_scores(velocity)
-        norm_spike = self.normalize_scores(spike_detection)
+        # Calculate individual components in one pass over the posts
+        if components is None:
+            components = self.calculate_all_components(ticker_posts)
         
-        # Combine with weights
+        # Components as rows of one (5, n_tickers) matrix, in ticker order
         component_weights = {
             'raw': 0.2,
             'weighted': 0.25,
@@ -231,54 +199,41 @@ class VolumeScorer:
             'velocity': 0.15,
             'spike': 0.15
         }
+        tickers = list(ticker_posts)
+        scores = np.array([[components[name][ticker] for ticker in tickers] for name in component_weights],
+                          dtype=np.float64)
         
-        final_scores = {}
-        for ticker in ticker_posts.keys():
-            score = (
-                norm_raw.get(ticker, 0) * component_weights['raw'] +
-                norm_weighted.get(ticker, 0) * component_weights['weighted'] +
-                norm_time.get(ticker, 0) * component_weights['time_weighted'] +
-                norm_velocity.get(ticker, 0) * component_weights['velocity'] +
-                norm_spike.get(ticker, 0) * component_weights['spike']
-            )
-            
-            # Apply cross-platform boost
-            score *= cross_platform.get(ticker, 1.0)
-            
-            final_scores[ticker] = score
+        # Normalize each component to 0-1; a component that is equal for every ticker normalizes to 1.0
+        mins = scores.min(axis=1, keepdims=True)
+        spans = scores.max(axis=1, keepdims=True) - mins
+        normalized = np.divide(scores - mins, spans, out=np.ones_like(scores), where=spans != 0)
+        
+        # Combine with weights, then apply cross-platform boost
+        combined = (normalized * np.array(list(component_weights.values()))[:, np.newaxis]).sum(axis=0)
+        combined *= np.array([components['cross_platform'][ticker] for ticker in tickers])
+        
+        final_scores = dict(zip(tickers, combined.tolist()))
         
         return final_scores
     
-    def get_volume_metrics(self, ticker_posts: Dict[str, List[Dict]]) -> Dict[str, Dict[str, Any]]:
-        """Get detailed volume metrics for each ticker"""
+    def get_volume_metrics(self, ticker_posts: Dict[str, List[Dict]],
+                           components: Dict[str, Dict[str, Any]] = None) -> Dict[str, Dict[str, Any]]:
+        """Get detailed volume metrics for each ticker (reusing components if given)"""
+        if components is None:
+            components = self.calculate_all_components(ticker_posts)
         metrics = {}
         
-        raw_vol = self.calculate_raw_volume(ticker_posts)
-        weighted_vol = self.calculate_weighted_volume(ticker_posts)
-        time_weighted = self.calculate_time_weighted_volume(ticker_posts)
-        velocity = self.calculate_velocity_score(ticker_posts)
-        spike = self.calculate_spike_detection(ticker_posts)
-        cross_platform = self.calculate_cross_platform_boost(ticker_posts)
-        
         for ticker in ticker_posts.keys():
-            # Calculate source distribution
-            sources = Counter()
-            total_engagement = 0
-            
-            for post in ticker_posts[ticker]:
-                sources[post.get('source', 'unknown')] += 1
-                total_engagement += post.get('engagement_score', 0)
-            
             metrics[ticker] = {
-                'raw_mentions': raw_vol.get(ticker, 0),
-                'weighted_volume': weighted_vol.get(ticker, 0),
-                'time_weighted_volume': time_weighted.get(ticker, 0),
-                'velocity_per_hour': velocity.get(ticker, 0),
-                'spike_ratio': spike.get(ticker, 0),
-                'cross_platform_boost': cross_platform.get(ticker, 1.0),
-                'total_engagement': total_engagement,
-                'platform_distribution': dict(sources),
-                'unique_authors': len(set(post.get('author', '') for post in ticker_posts[ticker]))
+                'raw_mentions': components['raw'].get(ticker, 0),
+                'weighted_volume': components['weighted'].get(ticker, 0),
+                'time_weighted_volume': components['time_weighted'].get(ticker, 0),
+                'velocity_per_hour': components['velocity'].get(ticker, 0),
+                'spike_ratio': components['spike'].get(ticker, 0),
+                'cross_platform_boost': components['cross_platform'].get(ticker, 1.0),
+                'total_engagement': components['total_engagement'][ticker],
+                'platform_distribution': components['platform_distribution'][ticker],
+                'unique_authors': components['unique_authors'][ticker]
             }
         
         return metrics 
\ No newline at end of file
@@ -0,0 +1,36 @@
+import unittest
+
+from config import Config
+
+class ConfigTest(unittest.TestCase):
+    """Dotted lookups stay in step with the configuration"""
+
+    def setUp(self):
+        self.config = Config()
+
+    def test_mutating_a_returned_section_does_not_change_lookups(self):
+        top_n = self.config.get('scoring.top_n_tickers')
+
+        scoring = self.config.get('scoring')
+        scoring['top_n_tickers'] = top_n + 100
+
+        self.assertEqual(self.config.get('scoring.top_n_tickers'), top_n)
+        self.assertEqual(self.config.get('scoring')['top_n_tickers'], top_n)
+
+    def test_mutating_a_returned_list_does_not_change_lookups(self):
+        subreddits = self.config.get('reddit.subreddits')
+
+        self.config.get('reddit.subreddits').append('pennystocks')
+
+        self.assertEqual(self.config.get('reddit.subreddits'), subreddits)
+
+    def test_set_invalidates_memoized_lookups(self):
+        top_n = self.config.get('scoring.top_n_tickers')
+
+        self.config.set('scoring.top_n_tickers', top_n + 1)
+
+        self.assertEqual(self.config.get('scoring.top_n_tickers'), top_n + 1)
+        self.assertEqual(self.config.get('scoring')['top_n_tickers'], top_n + 1)
+
+if __name__ == '__main__':
+    unittest.main()
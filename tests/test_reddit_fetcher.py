@@ -0,0 +1,73 @@
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from data_fetcher.base_fetcher import _SHARED_SESSION
+from data_fetcher.reddit_fetcher import RedditFetcher
+
+REDDIT_CONFIG = {
+    'client_id': 'test-client-id',
+    'client_secret': 'test-client-secret',
+    'user_agent': 'HypeFinder/1.0 (tests)',
+    'subreddits': ['wallstreetbets', 'stocks'],
+}
+
+class RedditFetcherTest(unittest.TestCase):
+    """RedditFetcher behaviour that needs no network access"""
+
+    def setUp(self):
+        # Skip the connection test made while setting up the main client
+        patcher = mock.patch.object(RedditFetcher, '_setup_reddit_client', return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.fetcher = RedditFetcher(REDDIT_CONFIG)
+
+    def test_praw_client_leaves_shared_session_headers_alone(self):
+        user_agent = _SHARED_SESSION.headers.get('User-Agent')
+
+        client = self.fetcher._create_reddit_client()
+
+        self.assertEqual(_SHARED_SESSION.headers.get('User-Agent'), user_agent)
+        self.assertIsNot(client._core._requestor._http, _SHARED_SESSION)
+        self.assertIn('HypeFinder/1.0 (tests)', client._core._requestor._http.headers['User-Agent'])
+
+    def test_clients_share_one_reddit_rate_limiter(self):
+        first = self.fetcher._create_reddit_client()
+        second = self.fetcher._create_reddit_client()
+
+        self.assertIs(first._core._requestor._rate_limiter, second._core._requestor._rate_limiter)
+
+    def test_close_shuts_down_the_worker_pool(self):
+        self.fetcher.close()
+
+        with self.assertRaises(RuntimeError):
+            self.fetcher._executor.submit(lambda: None)
+
+    def test_parse_posts_skips_only_posts_with_bad_engagement_fields(self):
+        raw_posts = [
+            {'id': 'good1', 'title': 'Buying $GME', 'score': 10, 'upvote_ratio': 0.5, 'num_comments': 3},
+            {'id': 'bad', 'title': 'Buying $AMC', 'score': None, 'num_comments': 'many'},
+            {'id': 'good2', 'title': 'Selling $TSLA', 'score': 4, 'upvote_ratio': 1, 'num_comments': 0},
+        ]
+
+        posts = list(self.fetcher.parse_posts(raw_posts))
+
+        self.assertEqual([post['id'] for post in posts], ['good1', 'good2'])
+        self.assertEqual([post['engagement_score'] for post in posts], [11.0, 4.0])
+
+    def test_top_comments_skip_deleted_accounts_and_deleted_comments(self):
+        def comment(comment_id, author, body, score):
+            return SimpleNamespace(id=comment_id, author=author, body=body, score=score, created_utc=1.0)
+
+        post = SimpleNamespace(id='post', comments=[
+            comment('c1', SimpleNamespace(name='alice'), 'Loading up on more $GME shares', 30),
+            comment('c2', None, 'This account is gone but the comment text is not', 20),
+            comment('c3', None, '[deleted]', 10),
+        ])
+
+        comments = self.fetcher._get_top_comments(post, limit=5)
+
+        self.assertEqual([(c['id'], c['author']) for c in comments], [('c1', 'alice')])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+from datetime import datetime, timedelta
+
+from scorer.sentiment_scorer import SentimentScorer
+
+def _ticker_posts(count):
+    """count posts per ticker, enough for the parallel path, with repeated texts"""
+    start = datetime(2024, 1, 2, 9, 0)
+    texts = ['{} to the moon, buying more calls', 'Selling my {} shares, this is a dump',
+             '{} is going nowhere {}', 'Holding {} with diamond hands #{}']
+    ticker_posts = {}
+    for ticker in ('GME', 'AMC'):
+        ticker_posts[ticker] = [
+            {
+                'text': texts[i % len(texts)].format(ticker, i % 7),
+                'source': 'reddit' if i % 2 else 'twitter',
+                'timestamp': (start + timedelta(minutes=i)).isoformat()
+            }
+            for i in range(count)
+        ]
+    return ticker_posts
+
+class SentimentScorerTest(unittest.TestCase):
+    """In-process and worker-process sentiment scoring"""
+
+    def test_scoring_stays_in_process_by_default(self):
+        self.assertEqual(SentimentScorer().workers, 1)
+
+    def test_worker_processes_give_the_same_scores_and_report_their_cache_use(self):
+        ticker_posts = _ticker_posts(600)
+        in_process = SentimentScorer()
+        parallel = SentimentScorer({'workers': 2})
+
+        self.assertEqual(parallel.calculate_comprehensive_sentiment_score(ticker_posts),
+                         in_process.calculate_comprehensive_sentiment_score(ticker_posts))
+
+        # Every keyword lookup made in a worker is counted as a hit or a miss
+        expected = in_process.get_cache_stats()['keyword']
+        reported = parallel.get_cache_stats()['keyword']
+        self.assertEqual(reported['hits'] + reported['misses'], expected['hits'] + expected['misses'])
+        self.assertEqual(reported['size'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
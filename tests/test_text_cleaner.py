@@ -0,0 +1,19 @@
+import unittest
+
+from parser.text_cleaner import TextCleaner
+
+class TextCleanerTest(unittest.TestCase):
+    """Phone number stripping in clean_social_media"""
+
+    def setUp(self):
+        self.cleaner = TextCleaner()
+
+    def test_dollar_prices_are_not_stripped_as_phone_numbers(self):
+        self.assertEqual(self.cleaner.clean_social_media('Price target $1000000 by June'),
+                         'Price target $1000000 by June')
+
+    def test_standalone_phone_numbers_are_stripped(self):
+        self.assertEqual(self.cleaner.clean_social_media('Call 5551234567 now'), 'Call now')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+
+from parser.ticker_parser import TickerParser
+
+class TickerParserTest(unittest.TestCase):
+    """Ticker extraction results"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = TickerParser()
+
+    def test_overlapping_pattern_matches_are_all_reported(self):
+        # "SHORT STOCK" is both an "X stock" and a "short X" mention
+        self.assertEqual(sorted(self.parser.extract_tickers_from_text('SHORT STOCK')), ['SHORT', 'STOCK'])
+        # "$BUY" and "BUY GME" overlap on BUY
+        self.assertEqual(sorted(self.parser.extract_tickers_from_text('$BUY GME now')), ['GME'])
+
+    def test_batch_matches_per_text_extraction_across_text_boundaries(self):
+        # Adjacent texts end and start with pattern pieces that would form a
+        # match if the joined scan buffer let them run together
+        texts = [
+            'time to buy', 'AAPL stock is up',
+            'GME', 'shares are flying',
+            'going long', 'TSLA',
+            'SHORT', 'STOCK',
+            'all in on $', 'AMC',
+            'DOGE', 'BTC pair',
+            'picked up some $GME', '',
+            'DOGEBTC', 'ETH',
+            'sell', 'sell',
+        ]
+
+        batch = self.parser.extract_tickers_from_texts(texts)
+
+        self.assertEqual([sorted(tickers) for tickers in batch],
+                         [sorted(self.parser.extract_tickers_from_text(text)) for text in texts])
+        self.assertEqual(batch[1], ['AAPL'])
+        self.assertEqual(batch[2], [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, 'web_ui'))
+
+import server
+
+class HistoryEndpointTest(unittest.TestCase):
+    """/api/history with hand-edited or older history files"""
+
+    def setUp(self):
+        handle, self.history_file = tempfile.mkstemp(suffix='.csv')
+        os.close(handle)
+        self.addCleanup(os.remove, self.history_file)
+        patcher = mock.patch.object(server, 'HISTORY_FILE', self.history_file)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = server.app.test_client()
+
+    def test_blank_and_malformed_cells_do_not_fail_the_response(self):
+        with open(self.history_file, 'w', encoding='utf-8') as f:
+            f.write('timestamp,ticker,mentions,sentiment_score,hype_score,rank\n'
+                    '2024-01-02T09:00:00,GME,12,0.25,1.5,1\n'
+                    '2024-01-02T09:00:00,AMC,,0.1,n/a,2\n'
+                    '2024-01-02T09:00:00,TSLA,7\n')
+
+        response = self.client.get('/api/history')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['data'], [
+            {'timestamp': '2024-01-02T09:00:00', 'ticker': 'GME', 'mentions': 12,
+             'sentiment_score': 0.25, 'hype_score': 1.5, 'rank': 1},
+            {'timestamp': '2024-01-02T09:00:00', 'ticker': 'AMC', 'mentions': None,
+             'sentiment_score': 0.1, 'hype_score': 'n/a', 'rank': 2},
+            {'timestamp': '2024-01-02T09:00:00', 'ticker': 'TSLA', 'mentions': 7,
+             'sentiment_score': None, 'hype_score': None, 'rank': None},
+        ])
+
+class ServerImportTest(unittest.TestCase):
+    """Importing the server module has no process-wide side effects on the working directory"""
+
+    def test_import_keeps_the_working_directory(self):
+        with tempfile.TemporaryDirectory() as cwd:
+            output = subprocess.run(
+                [sys.executable, '-c', 'import os, server; print(os.getcwd())'],
+                cwd=cwd, capture_output=True, text=True, check=True,
+                env={**os.environ, 'PYTHONPATH': os.path.join(PROJECT_ROOT, 'web_ui')}
+            ).stdout
+
+            self.assertEqual(output.strip(), os.path.realpath(cwd))
+
+if __name__ == '__main__':
+    unittest.main()
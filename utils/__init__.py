@@ -2,5 +2,6 @@
 
 from .logger import setup_logger
 from .file_utils import save_to_csv, load_ticker_list
+from .time_utils import parse_timestamp
 
-__all__ = ['setup_logger', 'save_to_csv', 'load_ticker_list'] 
\ No newline at end of file
+__all__ = ['setup_logger', 'save_to_csv', 'load_ticker_list', 'parse_timestamp'] 
\ No newline at end of file
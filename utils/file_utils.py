@@ -1,5 +1,4 @@
 import csv
-import pandas as pd
 from typing import List, Dict, Any, Optional
 import os
 
@@ -11,10 +10,12 @@ def save_to_csv(data: List[Dict[str, Any]], filename: str, fieldnames: Optional[
     if fieldnames is None:
         fieldnames = list(data[0].keys())
     
-    with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(data)
+    # Rows go out as plain lists through a 1 MiB buffer; DictWriter would re-check
+    # every row's keys against the fieldnames
+    with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(fieldnames)
+        writer.writerows([[row.get(field, '') for field in fieldnames] for row in data])
 
 def load_ticker_list(filename: str = 'tickers.csv') -> List[str]:
     """Load known ticker symbols from CSV file"""
@@ -25,9 +26,11 @@ def load_ticker_list(filename: str = 'tickers.csv') -> List[str]:
         return ['AAPL', 'GOOGL', 'MSFT', 'TSLA', 'AMZN', 'META', 'NVDA', 'AMD', 'SPY', 'QQQ']
     
     try:
-        df = pd.read_csv(filename)
-        # Assume first column contains ticker symbols
-        tickers = df.iloc[:, 0].str.upper().tolist()
+        with open(filename, newline='', encoding='utf-8') as csvfile:
+            reader = csv.reader(csvfile)
+            next(reader, None)  # Skip header row
+            # Assume first column contains ticker symbols
+            tickers = [row[0].upper() for row in reader if row and row[0]]
     except Exception as e:
         print(f"Error loading ticker list: {e}")
         return []
@@ -49,8 +52,11 @@ def create_sample_ticker_file(filename: str = 'tickers.csv') -> None:
         for ticker in sample_tickers:
             writer.writerow([ticker])
 
-def append_to_history(data: Dict[str, Any], filename: str = 'hype_history.csv') -> None:
-    """Append hype results to historical data file"""
+def append_to_history(entries: List[Dict[str, Any]], filename: str = 'hype_history.csv') -> None:
+    """Append a batch of hype results to historical data file"""
+    if not entries:
+        return
+    
     file_exists = os.path.exists(filename)
     
     with open(filename, 'a', newline='', encoding='utf-8') as csvfile:
@@ -60,4 +66,4 @@ def append_to_history(data: Dict[str, Any], filename: str = 'hype_history.csv')
         if not file_exists:
             writer.writeheader()
         
-        writer.writerow(data) 
\ No newline at end of file
+        writer.writerows(entries)
@@ -0,0 +1,9 @@
+from datetime import datetime
+from functools import lru_cache
+
+# The volume, sentiment and hype scorers all parse the same post timestamps,
+# so each distinct string is only parsed once
+@lru_cache(maxsize=65536)
+def parse_timestamp(timestamp_str: str) -> datetime:
+    """Parse an ISO 8601 timestamp, accepting a trailing 'Z' for UTC"""
+    return datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
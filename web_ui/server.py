@@ -6,20 +6,53 @@ Provides REST API endpoints for the web UI
 
 import os
 import sys
+import csv
 import json
-import subprocess
+from collections import deque
 from datetime import datetime
 from flask import Flask, request, jsonify, send_from_directory
 from flask_cors import CORS
 
 # Add the parent directory to the path to import HypeFinder modules
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
 
 from config import config
+from cli.main import run_scan
+
+# Scans run in-process, so the project files the CLI uses (config.json, tickers.csv,
+# hype_history.csv) are resolved against the project root explicitly rather than
+# against the working directory of whatever process imports this module
+if not os.getenv('CONFIG_FILE'):
+    config.reload(os.path.join(PROJECT_ROOT, 'config.json'))
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for all routes
 
+# Scan history written by the CLI and the in-process scans
+HISTORY_FILE = os.path.join(PROJECT_ROOT, 'hype_history.csv')
+
+# Column types of hype_history.csv rows (see utils.file_utils.append_to_history)
+HISTORY_FIELD_TYPES = {
+    'mentions': int,
+    'sentiment_score': float,
+    'hype_score': float,
+    'rank': int
+}
+
+def _convert_history_value(field, value):
+    """History cell as its column's type: None when blank, the string as read when malformed"""
+    convert = HISTORY_FIELD_TYPES.get(field)
+    if value is None or (convert is not None and not value.strip()):
+        return None
+    if convert is None:
+        return value
+    
+    try:
+        return convert(value)
+    except ValueError:
+        return value
+
 # Serve static files from the web_ui directory
 @app.route('/')
 def index():
@@ -33,34 +66,14 @@ def static_files(filename):
 def api_status():
     """Get system status and API credentials status"""
     try:
-        # Run the status command
-        result = subprocess.run(
-            ['python3', 'main.py', 'status', '--show-credentials'],
-            capture_output=True,
-            text=True,
-            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        )
-        
-        # Parse the output to extract status information
-        output = result.stdout
+        credentials = config.validate_api_credentials()
         
         status = {
-            'twitter': 'Unknown',
-            'reddit': 'Unknown',
+            'twitter': 'Valid' if credentials['twitter'] else 'Unknown',
+            'reddit': 'Valid' if credentials['reddit'] else 'Unknown',
             'system': 'Ready'
         }
         
-        # Look for status indicators in the output
-        if 'Twitter: ✓ Valid' in output:
-            status['twitter'] = 'Valid'
-        elif 'Twitter API authentication failed' in output:
-            status['twitter'] = 'Error'
-            
-        if 'Reddit: ✓ Valid' in output:
-            status['reddit'] = 'Valid'
-        elif 'Reddit API authentication failed' in output:
-            status['reddit'] = 'Error'
-            
         return jsonify(status)
         
     except Exception as e:
@@ -90,148 +103,38 @@ def api_scan():
                 'error': 'At least one data source must be selected'
             }), 400
         
-        # Build the command
-        cmd = ['python3', 'main.py', 'scan']
-        
-        # Add sources
-        for source in sources:
-            cmd.extend(['--sources', source])
-        
-        # Add other parameters
-        cmd.extend([
-            '--top', str(top_n),
-            '--min-mentions', str(min_mentions),
-            '--output', output_format
-        ])
-        
-        print(f"Running command: {' '.join(cmd)}")
-        
-        # Run the scan
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        )
-        
-        if result.returncode != 0:
-            return jsonify({
-                'success': False,
-                'error': f'Scan failed: {result.stderr}'
-            }), 500
-        
-        # Parse the output to extract results
-        output = result.stdout
+        # Run the scan in this process; results come back as data, not console text
+        scan = run_scan(sources, top_n, min_mentions, output_format, base_dir=PROJECT_ROOT)
+        results = scan['results']
+        
+        tickers = [
+            {
+                'rank': result['rank'],
+                'ticker': result['ticker'],
+                'hype_score': result['hype_score'],
+                'volume_score': result['volume_score'],
+                'sentiment_score': result['sentiment_score'],
+                'mentions': result['mention_count'],
+                'platforms': result['platforms']
+            }
+            for result in results
+        ]
         
-        # Extract ticker data from the output
-        tickers = []
         summary = {}
-        
-        # Look for the ticker table in the output
-        lines = output.split('\n')
-        in_table = False
-        
-        for line in lines:
-            line = line.strip()
-            
-            # Look for table start - the actual format from CLI output
-            if '🔥 Top' in line and 'Trending Tickers' in line:
-                in_table = True
-                continue
-                
-            # Look for table end
-            if '📊 Scan Summary' in line:
-                in_table = False
-                break
-                
-            # Parse table rows - the actual format has spaces, not pipes
-            if in_table and not line.startswith('=') and not line.startswith('Rank') and not line.startswith('--') and len(line) > 10:
-                # The format is: "1    $BTC     1.475    1.177    0.165      36       reddit,redd"
-                # Split by multiple spaces and filter out empty strings
-                parts = [p for p in line.split('  ') if p.strip()]
-                
-                # Debug: print the parts we're trying to parse
-                print(f"Parsing line: {line}")
-                print(f"Parts: {parts}")
-                
-                if len(parts) >= 6:
-                    try:
-                        # Clean up the ticker name (remove any extra spaces)
-                        ticker_name = parts[1].strip()
-                        
-                        ticker_data = {
-                            'rank': int(parts[0]),
-                            'ticker': ticker_name,
-                            'hype_score': float(parts[2]),
-                            'volume_score': float(parts[3]),
-                            'sentiment_score': float(parts[4]),
-                            'mentions': int(parts[5]),
-                            'platforms': [p.strip() for p in parts[6].split(',')] if len(parts) > 6 else []
-                        }
-                        tickers.append(ticker_data)
-                        print(f"Successfully parsed ticker: {ticker_name}")
-                    except (ValueError, IndexError) as e:
-                        print(f"Error parsing line: {line} - {e}")
-                        continue
-        
-        # Extract summary information
-        for line in lines:
-            if 'Tickers analyzed:' in line:
-                try:
-                    summary['tickers_analyzed'] = int(line.split(':')[1].strip())
-                except:
-                    pass
-            elif 'Total mentions:' in line:
-                try:
-                    summary['total_mentions'] = int(line.split(':')[1].strip())
-                except:
-                    pass
-            elif 'Average hype score:' in line:
-                try:
-                    summary['average_hype_score'] = float(line.split(':')[1].strip())
-                except:
-                    pass
-            elif 'Top ticker:' in line:
-                try:
-                    summary['top_ticker'] = line.split(':')[1].strip()
-                except:
-                    pass
-        
-        # Debug: Print what we found
-        print(f"Found {len(tickers)} tickers in output")
-        print(f"Raw output length: {len(output)}")
-        
-        # If no tickers found but we have summary data, try a different parsing approach
-        if len(tickers) == 0 and summary:
-            print("No tickers parsed, trying alternative parsing...")
-            # Try to extract from the raw output more aggressively
-            lines = output.split('\n')
-            for line in lines:
-                if not line.startswith('=') and not line.startswith('Rank') and not line.startswith('--') and len(line) > 10:
-                    # Try space-based parsing
-                    parts = [p for p in line.split('  ') if p.strip()]
-                    if len(parts) >= 6:
-                        try:
-                            ticker_data = {
-                                'rank': int(parts[0]),
-                                'ticker': parts[1].strip(),
-                                'hype_score': float(parts[2]),
-                                'volume_score': float(parts[3]),
-                                'sentiment_score': float(parts[4]),
-                                'mentions': int(parts[5]),
-                                'platforms': [p.strip() for p in parts[6].split(',')] if len(parts) > 6 else []
-                            }
-                            tickers.append(ticker_data)
-                        except (ValueError, IndexError) as e:
-                            print(f"Error parsing line: {line} - {e}")
-                            continue
+        if results:
+            scan_summary = scan['summary']
+            summary = {
+                'tickers_analyzed': scan_summary['total_tickers'],
+                'total_mentions': scan_summary['total_mentions'],
+                'average_hype_score': scan_summary['avg_hype_score'],
+                'top_ticker': f"${scan_summary['top_ticker']} ({scan_summary['top_hype_score']:.3f})"
+            }
         
         return jsonify({
             'success': True,
             'data': {
                 'tickers': tickers,
-                'summary': summary,
-                'raw_output': output[:500] + "..." if len(output) > 500 else output  # Truncate for debugging
+                'summary': summary
             }
         })
         
@@ -265,23 +168,25 @@ def api_config():
 def api_history():
     """Get scan history from CSV file"""
     try:
-        history_file = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'hype_history.csv')
-        
-        if not os.path.exists(history_file):
+        if not os.path.exists(HISTORY_FILE):
             return jsonify({
                 'success': True,
                 'data': []
             })
         
-        import pandas as pd
-        df = pd.read_csv(history_file)
-        
-        # Convert to list of dictionaries
-        history = df.to_dict('records')
+        # Stream the file and keep only the last 20 entries instead of loading it all
+        with open(HISTORY_FILE, newline='', encoding='utf-8') as csvfile:
+            history = deque(csv.DictReader(csvfile), maxlen=20)
         
+        # A row written before a column existed, or edited by hand, must not fail the
+        # whole response; cells beyond the header (collected under None) are dropped
         return jsonify({
             'success': True,
-            'data': history[-20:]  # Return last 20 entries
+            'data': [
+                {field: _convert_history_value(field, value) for field, value in entry.items()
+                 if field is not None}
+                for entry in history
+            ]
         })
         
     except Exception as e:
@@ -300,10 +205,14 @@ def api_health():
     })
 
 if __name__ == '__main__':
+    # start_web_ui.py passes the free port it found through the environment
+    port = int(os.environ.get('HYPEFINDER_PORT', 8082))
+    
     print("🚀 Starting HypeFinder Web Server...")
-    print("📱 Open your browser to: http://localhost:8082")
-    print("🔧 API endpoints available at: http://localhost:8082/api/")
+    print(f"📱 Open your browser to: http://localhost:{port}")
+    print(f"🔧 API endpoints available at: http://localhost:{port}/api/")
     print("⏹️  Press Ctrl+C to stop the server")
     print()
     
-    app.run(debug=True, host='0.0.0.0', port=8082) 
\ No newline at end of file
+    # Debug mode's reloader imports everything twice; opt in with HYPEFINDER_DEBUG=1
+    app.run(debug=os.environ.get('HYPEFINDER_DEBUG') == '1', host='0.0.0.0', port=port, threaded=True) 
\ No newline at end of file
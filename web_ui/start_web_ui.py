@@ -48,19 +48,6 @@ def main():
         print("❌ Could not find a free port")
         sys.exit(1)
     
-    # Update server.py with the new port
-    server_file = Path(__file__).parent / "server.py"
-    if server_file.exists():
-        with open(server_file, 'r') as f:
-            content = f.read()
-        
-        # Update port in the file
-        content = content.replace('port=8081', f'port={port}')
-        content = content.replace('http://localhost:8081', f'http://localhost:{port}')
-        
-        with open(server_file, 'w') as f:
-            f.write(content)
-    
     print(f"🌐 Starting server on port {port}")
     print(f"📱 Open your browser to: http://localhost:{port}")
     print(f"🔧 API endpoints available at: http://localhost:{port}/api/")
@@ -68,10 +55,10 @@ def main():
     print()
     
     try:
-        # Start the server
+        # Start the server, passing the port through the environment
         subprocess.run([
             sys.executable, "server.py"
-        ], cwd=Path(__file__).parent)
+        ], cwd=Path(__file__).parent, env={**os.environ, 'HYPEFINDER_PORT': str(port)})
     except KeyboardInterrupt:
         print("\n👋 Server stopped by user")
     except Exception as e: